@@ -1,10 +1,35 @@
 import argparse
+import json
 from logging_config import LoggingConfig 
 from framework.src.core import Framework
+from framework.src.database_manager import REPOSITORY_PROFILES, EXPORT_FORMATS, QUAD_FORMATS
+from framework.src.shard_manager import SHARD_STRATEGIES
 
 # Configure logging
 logger = LoggingConfig.setup("cli")
 
+def _plugin_params(args) -> dict:
+    """Collect the optional plugin parameters given on the command line."""
+    params = {}
+    if args.profile:
+        params["profile"] = args.profile
+    if args.bulk_import:
+        params["bulk_import"] = True
+    if args.import_dir:
+        params["import_directory"] = args.import_dir
+    if args.reinfer:
+        params["reinfer_ruleset"] = args.reinfer
+    if args.stream:
+        params["stream"] = True
+    if args.tee:
+        params["tee"] = args.tee
+    if args.shard:
+        params["shards"] = args.shard
+        params["shard_by"] = args.shard_by
+    if args.resume:
+        params["resume"] = True
+    return params
+
 def main():
     parser = argparse.ArgumentParser(prog="kgtoolkit", description="Knowledge Graph Toolkit CLI")
     subparsers = parser.add_subparsers(dest="command")
@@ -18,11 +43,59 @@ def main():
     register_parser.add_argument("-path", type=str, help="Optional path to plugin file")
 
 
+    # Options shared by commands that execute a plugin
+    plugin_parser = argparse.ArgumentParser(add_help=False)
+    plugin_parser.add_argument("plugin_name", type=str, help="Name of the plugin to run")
+    plugin_parser.add_argument("-input", type=str, required=True, help="Input file path")
+    plugin_parser.add_argument("-graphdb", type=str, help="GraphDB endpoint URL", default="http://localhost:8000")
+    plugin_parser.add_argument("-profile", type=str, choices=REPOSITORY_PROFILES, help="Provisioning profile for newly created repositories")
+    plugin_parser.add_argument("-bulk-import", action="store_true", help="Load generated files through GraphDB's server-side import")
+    plugin_parser.add_argument("-import-dir", type=str, metavar="PATH", help="Local path of GraphDB's server-side import directory")
+    plugin_parser.add_argument("-reinfer", type=str, metavar="RULESET", help="Switch to this ruleset and reinfer once after loading")
+    plugin_parser.add_argument("-stream", action="store_true", help="Stream the plugin output straight into GraphDB")
+    plugin_parser.add_argument("-tee", type=str, metavar="PATH", help="Also write streamed output to this file")
+    plugin_parser.add_argument("-shard", type=str, action="append", metavar="URL", help="GraphDB URL (optionally with /repositories/<name>) to shard writes over; repeat per shard")
+    plugin_parser.add_argument("-resume", "--resume", action="store_true", help="Skip inputs and batches an earlier run of the same job already finished")
+    plugin_parser.add_argument("-shard-by", type=str, choices=SHARD_STRATEGIES, default="source", help="Distribute writes by source file or by named graph")
+
     # Run plugin
-    run_parser = subparsers.add_parser("run", help="Run a specific plugin")
-    run_parser.add_argument("plugin_name", type=str, help="Name of the plugin to run")
-    run_parser.add_argument("-input", type=str, required=True, help="Input file path")
-    run_parser.add_argument("-graphdb", type=str, help="GraphDB endpoint URL", default="http://localhost:8000")
+    run_parser = subparsers.add_parser("run", parents=[plugin_parser], help="Run a specific plugin")
+    run_parser.add_argument("-watch", "--watch", action="store_true", help="Keep running and reprocess new or modified input files")
+    run_parser.add_argument("-debounce", type=float, default=2.0, help="Seconds to wait for changes to settle in watch mode")
+
+
+    # Query
+    query_parser = subparsers.add_parser("query", help="Run a SPARQL SELECT/ASK query")
+    query_parser.add_argument("query", type=str, help="SPARQL query string")
+    query_parser.add_argument("-repository", type=str, default="network", help="Repository to query")
+    query_parser.add_argument("-graphdb", type=str, help="GraphDB endpoint URL", default="http://localhost:8000")
+    query_parser.add_argument("-shard", type=str, action="append", metavar="URL", help="Query this shard; repeat to federate over several shards")
+
+    # Queue a plugin run for the workers
+    enqueue_parser = subparsers.add_parser("enqueue", parents=[plugin_parser], help="Queue a plugin run for a worker")
+    enqueue_parser.add_argument("-queue", type=str, default="jobs.db", help="Path to the job queue database")
+
+    # Worker processing queued plugin runs
+    worker_parser = subparsers.add_parser("worker", help="Process queued plugin runs")
+    worker_parser.add_argument("-queue", type=str, default="jobs.db", help="Path to the job queue database")
+    worker_parser.add_argument("-lease", type=float, default=60.0, help="Job lease duration in seconds")
+    worker_parser.add_argument("-once", action="store_true", help="Exit when the queue is empty")
+
+    # Job status
+    jobs_parser = subparsers.add_parser("jobs", help="List queued jobs and their status")
+    jobs_parser.add_argument("-queue", type=str, default="jobs.db", help="Path to the job queue database")
+    jobs_parser.add_argument("-status", type=str, choices=["queued", "running", "done", "failed"], help="Only show jobs with this status")
+
+    # Export repository
+    export_parser = subparsers.add_parser("export", help="Export a repository to RDF files")
+    export_parser.add_argument("repository", type=str, help="Name of the repository to export")
+    export_parser.add_argument("-output", type=str, required=True, help="Output directory")
+    export_parser.add_argument("-graphdb", type=str, help="GraphDB endpoint URL", default="http://localhost:8000")
+    export_parser.add_argument("-format", type=str, choices=EXPORT_FORMATS, default="turtle", help="RDF serialisation")
+    export_parser.add_argument("-gzip", action="store_true", help="Gzip the exported files")
+    export_parser.add_argument("-partition", type=str, choices=["graph", "subject"], default="graph", help="Split the export by named graph or by subject hash")
+    export_parser.add_argument("-parts", type=int, default=4, help="Number of partitions when splitting by subject")
+    export_parser.add_argument("-workers", type=int, default=4, help="Number of concurrent export requests")
 
     args = parser.parse_args()
 
@@ -42,11 +115,46 @@ def main():
         framework.register_plugin(args.plugin_name, args.path)
 
     elif args.command == "run":
-        framework.run_plugin(args.plugin_name, args.input, args.graphdb)
+        params = _plugin_params(args)
+        if args.watch and args.stream:
+            run_parser.error("-stream cannot be combined with --watch")
+        if args.watch:
+            framework.watch_plugin(args.plugin_name, args.input, args.graphdb, params, debounce=args.debounce)
+        else:
+            framework.run_plugin(args.plugin_name, args.input, args.graphdb, params)
         # framework.set_input(args.input)
         # framework.set_graphdb(args.graphdb)  # Optional
         # framework.run()
 
+    elif args.command == "enqueue":
+        job_id = framework.enqueue_plugin(args.queue, args.plugin_name, args.input, args.graphdb, _plugin_params(args))
+        print(f"Queued job {job_id}.")
+
+    elif args.command == "worker":
+        framework.run_worker(args.queue, lease_seconds=args.lease, once=args.once)
+
+    elif args.command == "query":
+        result = framework.query(args.graphdb, args.repository, args.query, args.shard)
+        if result is not None:
+            print(json.dumps(result, indent=2))
+
+    elif args.command == "export":
+        if args.partition == "subject" and args.format in QUAD_FORMATS:
+            export_parser.error(f"-format {args.format} cannot be combined with -partition subject")
+        files = framework.export_repository(
+            args.graphdb, args.repository, args.output, rdf_format=args.format, compress=args.gzip,
+            partition=args.partition, partitions=args.parts, workers=args.workers
+        )
+        print(f"Exported {len(files)} file(s) to {args.output}.")
+
+    elif args.command == "jobs":
+        jobs = framework.list_jobs(args.queue, args.status)
+        if not jobs:
+            print("No jobs found.")
+        for job in jobs:
+            outcome = job["result"] if job["status"] == "done" else job["error"] or ""
+            print(f"{job['id']:>5}  {job['status']:<8} {job['plugin']:<20} {job['input']}  {job['worker'] or '-'}  {outcome}")
+
     else:
         parser.print_help()
 
@@ -0,0 +1,118 @@
+import os
+import json
+from logging_config import LoggingConfig
+
+logger = LoggingConfig.setup("checkpoint")
+
+class CheckpointJournal:
+    def __init__(self, path: str, resume: bool = False):
+        """
+        Append-only journal of the work a plugin run has finished.
+
+        Records which inputs were transformed into which outputs, which outputs were
+        committed to which repository and which ruleset each repository was last
+        reinferred with. Every entry stores the size and modification time of the files
+        involved, so an input that changed since is transformed and uploaded again rather
+        than skipped. A commit invalidates the repository's reinference.
+
+        Args:
+            path (str): Path of the JSON-lines journal file.
+            resume (bool): Continue from the existing journal instead of starting a new one.
+        """
+        self.path = path
+        self._transformed = {}   # input path -> (input signature, output path, output signature)
+        self._committed = set()  # (repository, output path, output signature)
+        self._reinferred = {}    # repository -> ruleset, while no batch was committed since
+
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        if resume:
+            self._load()
+            logger.info(f"Resuming from checkpoint '{path}': {len(self._transformed)} input(s) transformed, "
+                        f"{len(self._committed)} file(s) committed.")
+        else:
+            open(path, 'w').close()
+
+    def transformed_output(self, input_path: str) -> str | None:
+        """Return the output recorded for an unchanged input, or None if it must be transformed."""
+        entry = self._transformed.get(os.path.abspath(input_path))
+        if entry is None:
+            return None
+        input_signature, output_path, output_signature = entry
+        if self._signature(input_path) != input_signature or self._signature(output_path) != output_signature:
+            return None
+        return output_path
+
+    def mark_transformed(self, input_path: str, output_path: str):
+        input_path, output_path = os.path.abspath(input_path), os.path.abspath(output_path)
+        entry = (self._signature(input_path), output_path, self._signature(output_path))
+        self._transformed[input_path] = entry
+        self._append({"event": "transformed", "input": input_path, "input_signature": entry[0],
+                      "output": output_path, "output_signature": entry[2]})
+
+    def is_committed(self, file_path: str, repository: str) -> bool:
+        """Return True if this exact version of the file was already committed to the repository."""
+        file_path = os.path.abspath(file_path)
+        return (repository, file_path, self._signature(file_path)) in self._committed
+
+    def mark_committed(self, file_paths: list[str], repository: str):
+        """Record one successfully committed batch of files."""
+        batch = [(os.path.abspath(path), self._signature(path)) for path in file_paths]
+        self._committed.update((repository, path, signature) for path, signature in batch)
+        self._reinferred.pop(repository, None)
+        self._append({"event": "committed", "repository": repository,
+                      "files": [{"path": path, "signature": signature} for path, signature in batch]})
+
+    def needs_reinference(self, repository: str, ruleset: str) -> bool:
+        """Return False if the repository was reinferred with the ruleset after its last committed batch."""
+        return self._reinferred.get(repository) != ruleset
+
+    def mark_reinferred(self, repository: str, ruleset: str):
+        """Record a successful reinference of the repository with the ruleset."""
+        self._reinferred[repository] = ruleset
+        self._append({"event": "reinferred", "repository": repository, "ruleset": ruleset})
+
+    def _append(self, record: dict):
+        with open(self.path, 'a', encoding='utf-8') as journal:
+            journal.write(json.dumps(record) + "\n")
+            journal.flush()
+            os.fsync(journal.fileno())
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+
+        with open(self.path, 'rb') as journal:
+            lines = journal.read().split(b"\n")
+
+        if lines[-1]:
+            # The last entry was cut short by a crash; drop it so new entries start on a fresh line
+            with open(self.path, 'r+b') as journal:
+                journal.truncate(sum(len(line) + 1 for line in lines[:-1]))
+
+        for line in lines[:-1]:
+            try:
+                record = json.loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                continue  # Entry damaged by a crash
+
+            if record["event"] == "transformed":
+                self._transformed[record["input"]] = (
+                    self._tuple(record["input_signature"]), record["output"], self._tuple(record["output_signature"])
+                )
+            elif record["event"] == "committed":
+                for entry in record["files"]:
+                    self._committed.add((record["repository"], entry["path"], self._tuple(entry["signature"])))
+                self._reinferred.pop(record["repository"], None)
+            elif record["event"] == "reinferred":
+                self._reinferred[record["repository"]] = record["ruleset"]
+
+    def _signature(self, path: str) -> tuple | None:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _tuple(self, signature) -> tuple | None:
+        # JSON turns the signature tuples into lists
+        return tuple(signature) if signature is not None else None
@@ -1,14 +1,23 @@
 from logging_config import LoggingConfig
+import os
 import sys
+import json
+import hashlib
 from framework.src.plugin_manager import PluginManager
 from framework.src.install_manager import InstallManager
 from framework.src.database_manager import DatabaseManager
+from framework.src.shard_manager import ShardManager
+from framework.src.watch_manager import WatchManager
+from framework.src.job_queue import JobQueue
+from framework.src.worker import Worker
+from framework.src.checkpoint import CheckpointJournal
 from framework.src.exceptions import PluginError, PluginNotFoundError, InvalidPluginError
 
 logger = LoggingConfig.setup("framework")
 
 class Framework:
-    def __init__(self):
+    def __init__(self, checkpoint_dir: str = ".kgtoolkit/checkpoints"):
+        self.checkpoint_dir = checkpoint_dir
         self._plugin_manager = PluginManager()
         self._install_manager = InstallManager()
         self._database_manager = DatabaseManager()
@@ -26,7 +35,8 @@ class Framework:
         """Ensure that all required dependencies are available."""
         self._install_manager.resolve_deps()
 
-    def run_plugin(self, plugin_name, input_path, graphdb_url):
+    def _prepare_plugin(self, plugin_name) -> bool:
+        """Register and load the plugin if needed. Returns False if it cannot be used."""
         if not self._plugin_manager.is_registered(plugin_name):
             logger.warning(f"Plugin '{plugin_name}' is not registered.")
             logger.info("Attempting to register it...")
@@ -34,7 +44,7 @@ class Framework:
                 self._plugin_manager.register_plugin(plugin_name)
             except FileNotFoundError:
                 logger.error(f"Aborting..")
-                return
+                return False
 
         if not self._plugin_manager.is_loaded(plugin_name):
             logger.info(f"Loading plugin '{plugin_name}'...")
@@ -42,22 +52,233 @@ class Framework:
                 self._plugin_manager.load_plugin(plugin_name)
             except Exception as e:
                 logger.error(f"Failed to load plugin '{plugin_name}': {e}")
-                return
+                return False
+
+        return True
+
+    def run_plugin(self, plugin_name, input_path, graphdb_url, params: dict = None, raise_errors: bool = False):
+        """
+        Run the plugin once. Returns its output, or None if the run failed.
+
+        With `raise_errors` a failed run raises instead, so callers such as queue
+        workers can record the actual cause.
+        """
+        if not self._prepare_plugin(plugin_name):
+            if raise_errors:
+                raise PluginError(f"Plugin '{plugin_name}' could not be registered or loaded.")
+            return None
 
         try:
-            ttl_file = self._plugin_manager.run_plugin(plugin_name, input_path)
+            params = {"input": input_path, **(params or {})}
+            database_manager = self._connect_database(graphdb_url, params)
+            checkpoint = self._checkpoint_for(plugin_name, graphdb_url, params)
+            self._plugin_manager.get_plugin(plugin_name).set_managers(database_manager=database_manager,
+                                                                      checkpoint=checkpoint)
+
+            if params.get("stream"):
+                ttl_file = self._stream_plugin(plugin_name, params, database_manager, checkpoint)
+            else:
+                ttl_file = self._plugin_manager.run_plugin(plugin_name, params)
             if ttl_file:
                 logger.info(f"Plugin '{plugin_name}' executed successfully. Output: {ttl_file}")
-                #self._database_manager.connect(graphdb_url)
-                #self._database_manager.upload_ttl(ttl_file)
+                return ttl_file
             else:
                 logger.error(f"Plugin '{plugin_name}' did not return a TTL file.")
+                if raise_errors:
+                    raise PluginError(f"Plugin '{plugin_name}' did not return any output; see the worker log.")
         except Exception as e:
             logger.error(f"Error while running plugin '{plugin_name}': {e}")
+            if raise_errors:
+                raise
+        finally:
+            self._plugin_manager.unload_plugin(plugin_name)
+            logger.info(f"Unloaded plugin '{plugin_name}' after execution.")
+
+    def _connect_database(self, graphdb_url, params: dict):
+        """
+        Return the database manager plugins should write through.
+
+        With a `shards` parameter (list of GraphDB URLs) writes are spread over those
+        shards by the `shard_by` strategy; otherwise the single `graphdb_url` is used.
+        """
+        if params.get("shards"):
+            return ShardManager(params["shards"], params.get("shard_by", "source"))
+        self._database_manager.connect(graphdb_url)
+        return self._database_manager
+
+    def _checkpoint_for(self, plugin_name, graphdb_url, params: dict) -> CheckpointJournal:
+        """
+        Open the checkpoint journal of a run.
+
+        Runs of the same plugin on the same input and target share a journal, so a
+        `resume` run picks up where the previous one stopped. A `checkpoint_dir` parameter
+        overrides the framework's checkpoint directory. Input paths are made
+        absolute first, so the same input given relative to another directory matches.
+        """
+        input_path = params.get("input")
+        if isinstance(input_path, list):
+            input_path = [os.path.abspath(path) for path in input_path]
+        elif input_path:
+            input_path = os.path.abspath(input_path)
+
+        run_key = json.dumps([plugin_name, input_path, graphdb_url, params.get("repository"),
+                              params.get("shards")], sort_keys=True, default=str)
+        run_id = hashlib.sha1(run_key.encode('utf-8')).hexdigest()[:16]
+        checkpoint_dir = params.get("checkpoint_dir") or self.checkpoint_dir
+        path = os.path.join(checkpoint_dir, f"{plugin_name}-{run_id}.jsonl")
+        return CheckpointJournal(path, resume=params.get("resume", False))
+
+    def _stream_plugin(self, plugin_name, params: dict, database_manager,
+                       checkpoint: CheckpointJournal = None) -> dict | None:
+        """
+        Pipe the documents yielded by the plugin's `stream` straight into the repository.
+
+        Each source document is sent as a separate upload, replacing its named graph if the
+        plugin gives one. The `repository`, `profile` and `reinfer_ruleset` parameters are
+        honoured as in a regular run, and `tee` optionally names a file that receives a copy
+        of the documents sent. Every uploaded source file is committed to the checkpoint
+        journal, so a `resume` run skips the unchanged sources an earlier run loaded and
+        only reinfers if it loaded something new since the last reinference.
+        """
+        plugin = self._plugin_manager.get_plugin(plugin_name)
+        repository = params.get("repository") or \
+            plugin.info().get("parameters", {}).get("repository", {}).get("default")
+        if not repository:
+            logger.error(f"No repository given for streaming plugin '{plugin_name}'.")
+            return None
+
+        # Checked once for the whole run rather than once per streamed document
+        if not database_manager.check_connection(repository, params.get("profile", "default")):
+            logger.error(f"Repository '{repository}' is not available. Skipping upload.")
+            return None
+
+        tee = None
+        committed, uploaded = [], []
+        unjournaled = False
+        try:
+            if params.get("tee"):
+                os.makedirs(os.path.dirname(params["tee"]) or '.', exist_ok=True)
+                tee = open(params["tee"], 'wb')
+
+            for source, graph, chunks in self._plugin_manager.stream_plugin(plugin_name, params) or []:
+                # Only sources that are files have a signature to tell whether they changed
+                journaled = checkpoint is not None and os.path.isfile(source)
+                if journaled and checkpoint.is_committed(source, repository):
+                    logger.info(f"Skipping '{source}': already committed to '{repository}'.")
+                    committed.append(source)
+                    continue
+
+                if not database_manager.upload_stream(chunks, repository, plugin.stream_mime_type, tee=tee,
+                                                      source=source, context=graph, replace=bool(graph)):
+                    logger.error(f"Streaming upload of '{source}' failed; {len(uploaded)} source(s) were loaded.")
+                    return None
+                uploaded.append(source)
+                if journaled:
+                    checkpoint.mark_committed([source], repository)
+                else:
+                    unjournaled = True
+        finally:
+            if tee:
+                tee.close()
+
+        if not committed and not uploaded:
+            logger.warning(f"Plugin '{plugin_name}' produced no streams.")
+            return None
+
+        reinfer_ruleset = params.get("reinfer_ruleset")
+        if reinfer_ruleset:
+            if checkpoint and not unjournaled and not checkpoint.needs_reinference(repository, reinfer_ruleset):
+                logger.info(f"Skipping reinference: '{repository}' was already reinferred with '{reinfer_ruleset}'.")
+            elif database_manager.switch_ruleset(repository, reinfer_ruleset) and checkpoint:
+                checkpoint.mark_reinferred(repository, reinfer_ruleset)
+
+        return {"repository": repository, "sources": committed + uploaded, "tee": params.get("tee")}
+
+    def watch_plugin(self, plugin_name, input_path, graphdb_url, params: dict = None,
+                     interval: float = 1.0, debounce: float = 2.0):
+        """
+        Keep the plugin loaded and rerun it on input files as they are added or modified.
+
+        Each debounce window runs the plugin once with the list of changed files as input
+        and asks it to replace their graphs in a single batch. A `reinfer_ruleset` is only
+        applied after the first window that loaded data; afterwards the repository already
+        runs with that ruleset and infers incrementally.
+        """
+        params = dict(params or {})
+        if params.get("stream"):
+            logger.error("Streaming is not supported in watch mode; changed files are uploaded in batches.")
+            return
+
+        if not self._prepare_plugin(plugin_name):
+            return
+
+        database_manager = self._connect_database(graphdb_url, params)
+        self._plugin_manager.get_plugin(plugin_name).set_managers(database_manager=database_manager)
+        reinfer_ruleset = params.pop("reinfer_ruleset", None)
+
+        def process(changed_files):
+            nonlocal reinfer_ruleset
+            window_params = {**params, "input": changed_files, "batch_upload": True}
+            if reinfer_ruleset:
+                window_params["reinfer_ruleset"] = reinfer_ruleset
+
+            result = self._plugin_manager.run_plugin(plugin_name, window_params)
+            if result:
+                reinfer_ruleset = None
+            logger.info(f"Plugin '{plugin_name}' reprocessed {len(changed_files)} file(s). Output: {result}")
+
+        watcher = WatchManager(input_path, interval=interval, debounce=debounce)
+        try:
+            watcher.watch(process)
+        except KeyboardInterrupt:
+            logger.info("Watch mode stopped.")
         finally:
             self._plugin_manager.unload_plugin(plugin_name)
             logger.info(f"Unloaded plugin '{plugin_name}' after execution.")
 
+    def enqueue_plugin(self, queue_path, plugin_name, input_path, graphdb_url, params: dict = None) -> int:
+        """
+        Queue a plugin run for a worker instead of running it in this process.
+
+        Paths are made absolute here, because workers resolve relative paths against their
+        own working directory. The job also records this process's checkpoint directory, so
+        a queued `resume` continues the same journal as a direct run would.
+        """
+        if input_path:
+            input_path = os.path.abspath(input_path)
+        params = dict(params or {})
+        for name in ("tee", "import_directory"):
+            if params.get(name):
+                params[name] = os.path.abspath(params[name])
+        params.setdefault("checkpoint_dir", os.path.abspath(self.checkpoint_dir))
+        return JobQueue(queue_path).enqueue(plugin_name, input_path, graphdb_url, params)
+
+    def run_worker(self, queue_path, lease_seconds: float = 60.0, once: bool = False):
+        """Process queued plugin runs in this process until interrupted."""
+        Worker(self, JobQueue(queue_path), lease_seconds=lease_seconds).run(once=once)
+
+    def export_repository(self, graphdb_url, repository, output_dir, **options) -> list[str]:
+        """Export a repository to RDF files. See `DatabaseManager.export_repository` for the options."""
+        self._database_manager.connect(graphdb_url)
+        return self._database_manager.export_repository(repository, output_dir, **options)
+
+    def query(self, graphdb_url, repository, query, shards: list[str] = None):
+        """
+        Run a SELECT/ASK query and return its SPARQL JSON results.
+
+        With `shards` the query runs against every shard in parallel and the rows are merged;
+        the rows of a SELECT DISTINCT query are deduplicated across shards.
+        """
+        if shards:
+            return ShardManager(shards).select(query, repository)
+
+        self._database_manager.connect(graphdb_url)
+        result = self._database_manager.execute_sparql_query(query, repository, accept='application/sparql-results+json')
+        return json.loads(result) if result is not None else None
+
+    def list_jobs(self, queue_path, status: str = None) -> list[dict]:
+        return JobQueue(queue_path).list_jobs(status)
+
     def list_plugins(self):
         return self._plugin_manager.list_available_plugins()
     
@@ -1,28 +1,80 @@
 import os
+import re
+import gzip
+import time
+import uuid
+import shutil
+import hashlib
 import requests
 import logging
 from urllib.parse import urljoin
+from concurrent.futures import ThreadPoolExecutor
 from logging_config import LoggingConfig
 
 logger = LoggingConfig.setup("database_manager")
 
+# GraphDB system namespace used to manage rulesets through SPARQL updates
+SYSTEM_NS = "http://www.ontotext.com/owlim/system#"
+
+# Named provisioning profiles used when a repository has to be created.
+# Each profile maps to the GraphDB repository parameters it sets.
+REPOSITORY_PROFILES = {
+    "default": {
+        "ruleset": "owl-horst-optimized",
+    },
+    "bulk-load": {
+        # No inference and no secondary indexes while loading instance data
+        "ruleset": "empty",
+        "entity-index-size": "50000000",
+        "enable-context-index": "false",
+        "enablePredicateList": "false",
+        "enable-literal-index": "false",
+        "in-memory-literal-properties": "false",
+        "check-for-inconsistencies": "false",
+    },
+    "query-optimized": {
+        "ruleset": "owl-horst-optimized",
+        "entity-index-size": "50000000",
+        "enable-context-index": "true",
+        "enablePredicateList": "true",
+        "enable-literal-index": "true",
+        "in-memory-literal-properties": "true",
+    },
+}
+
+# RDF serialisations supported by repository exports: name -> (MIME type, file extension)
+EXPORT_FORMATS = {
+    "turtle": ("text/turtle", "ttl"),
+    "ntriples": ("application/n-triples", "nt"),
+    "nquads": ("application/n-quads", "nq"),
+    "trig": ("application/trig", "trig"),
+    "rdfxml": ("application/rdf+xml", "rdf"),
+}
+
+# Formats that serialise the named graph of each statement
+QUAD_FORMATS = ("nquads", "trig")
+
 class DatabaseManager:
     def __init__(self):
         self.graphdb_url = None
         self.connected = False
+        self.import_directory = None
         self.query_headers = {
             'Content-Type': 'application/sparql-query',
             'Accept': 'text/turtle'  # Default to TTL results
         }
 
-    def connect(self, graphdb_url: str):
+    def connect(self, graphdb_url: str, import_directory: str = None):
         """
         Establish a connection to GraphDB. Does not target a specific repository.
 
         Args:
             graphdb_url (str): Base URL of the GraphDB server (e.g., http://localhost:7200)
+            import_directory (str, optional): Local path of the directory GraphDB reads
+                server-side imports from (e.g., the `graphdb/data` volume mount).
         """
         self.graphdb_url = graphdb_url.rstrip('/')
+        self.import_directory = import_directory
         self.connected = True
         logger.info(f"Connected to GraphDB at: {self.graphdb_url}")
 
@@ -30,24 +82,29 @@ class DatabaseManager:
         """Clear connection details and mark disconnected."""
         self.connected = False
         self.graphdb_url = None
+        self.import_directory = None
         logger.info("Disconnected from GraphDB.")
 
-    def check_connection(self, repository: str):
+    def check_connection(self, repository: str, profile: str = "default"):
         """
         Verify the specified repository exists and is reachable.
 
+        Only the repository's configuration is requested, so the check costs the same
+        for an empty repository as for one with billions of statements.
+
         Args:
             repository (str): Name of the repository to check.
+            profile (str): Provisioning profile used if the repository has to be created.
 
         Raises:
             GraphDBException: If connection fails or repository is missing.
         """
         if not self._ensure_connected(): return False
 
-        url = urljoin(self.graphdb_url + '/', f"repositories/{repository}/statements")
+        url = urljoin(self.graphdb_url + '/', f"rest/repositories/{repository}")
 
         try:
-            response = requests.get(url)
+            response = requests.get(url, headers={'Accept': 'application/json'})
 
             if 200 <= response.status_code < 300:
                 logger.info(f"Connection to repository '{repository}' verified.")
@@ -56,7 +113,7 @@ class DatabaseManager:
             elif response.status_code == 404:
                 logger.warning(f"Repository '{repository}' not found.")
                 logger.info(f"Attempting to create repository '{repository}'...")
-                return self._create_repository(repository)
+                return self._create_repository(repository, profile)
             
             else:
                 logger.error(f"Failed to access repository '{repository}'.")
@@ -66,7 +123,8 @@ class DatabaseManager:
             logger.error(f"Cannot reach the GraphDB server.")
             return False
     
-    def upload_file(self, file_path: str, repository: str, mime_type: str = "text/turtle") -> bool:
+    def upload_file(self, file_path: str, repository: str, mime_type: str = "text/turtle",
+                    context: str = None, replace: bool = False) -> bool:
         """
         Upload RDF content to the specified repository.
 
@@ -74,6 +132,8 @@ class DatabaseManager:
             file_path (str): Path to RDF file (e.g., .ttl, .rdf, .nt)
             repository (str): Target GraphDB repository.
             mime_type (str): RDF MIME type (e.g., text/turtle, application/rdf+xml)
+            context (str, optional): IRI of the named graph to load the triples into.
+            replace (bool): Replace the current content of `context` instead of adding to it.
 
         Raises:
             GraphDBException: If upload fails.
@@ -92,7 +152,10 @@ class DatabaseManager:
             url = urljoin(self.graphdb_url + '/', f"repositories/{repository}/statements")
             logger.info(f"Uploading '{file_path}' to repository '{repository}' as {mime_type}...")
 
-            response = requests.post(url, data=data, headers={'Content-Type': mime_type})
+            # PUT on a context replaces that named graph only
+            send = requests.put if replace and context else requests.post
+            response = send(url, data=data, headers={'Content-Type': mime_type},
+                            params=self._context_params(context))
 
             if response.status_code >= 200 and response.status_code < 300:
                 logger.info(f"Upload successful.")
@@ -105,13 +168,323 @@ class DatabaseManager:
             logger.error(f"Failed to upload file: {e}")
             return False
 
-    def execute_sparql_query(self, query: str, repository: str) -> str | None:
+    def upload_stream(self, chunks, repository: str, mime_type: str = "text/turtle", tee=None,
+                      source: str = None, context: str = None, replace: bool = False) -> bool:
+        """
+        Upload RDF content produced by an iterator, sending it as it is generated.
+
+        The chunks are sent with chunked transfer encoding, so the document is never
+        held in memory or written to disk as a whole. A run usually streams many
+        documents, so the repository is not checked here; call `check_connection` once
+        before the first upload.
+
+        Args:
+            chunks (Iterable[str | bytes]): Consecutive pieces of one RDF document.
+            repository (str): Target GraphDB repository.
+            mime_type (str): RDF MIME type of the document.
+            tee (BinaryIO, optional): Open binary file that also receives the streamed content.
+            source (str, optional): Name of the data source the stream was produced from.
+            context (str, optional): IRI of the named graph to load the triples into.
+            replace (bool): Replace the current content of `context` instead of adding to it.
+
+        Returns:
+            bool: True if the upload succeeded.
+        """
+        if not self._ensure_connected(): return False
+
+        sent = 0
+
+        def body():
+            nonlocal sent
+            for chunk in chunks:
+                data = chunk.encode('utf-8') if isinstance(chunk, str) else chunk
+                if tee:
+                    tee.write(data)
+                sent += len(data)
+                yield data
+
+        try:
+            url = urljoin(self.graphdb_url + '/', f"repositories/{repository}/statements")
+            logger.info(f"Streaming upload of '{source or 'stream'}' to repository '{repository}' as {mime_type}...")
+
+            # PUT on a context replaces that named graph only
+            send = requests.put if replace and context else requests.post
+            response = send(url, data=body(), headers={'Content-Type': mime_type},
+                            params=self._context_params(context))
+
+            if 200 <= response.status_code < 300:
+                logger.info(f"Streaming upload successful ({sent} bytes).")
+                return True
+            else:
+                logger.error(f"Streaming upload failed with status {response.status_code}: {response.text}")
+                return False
+
+        except Exception as e:
+            logger.error(f"Failed to stream upload: {e}")
+            return False
+
+    def upload_files(self, file_paths: list[str], repository: str, mime_type: str = "text/turtle",
+                     context: str = None) -> bool:
+        """
+        Upload several RDF files to the specified repository in a single request.
+
+        The files are concatenated, so they must use a format where that is valid
+        (e.g., Turtle or N-Triples).
+
+        Args:
+            file_paths (list[str]): Paths to RDF files.
+            repository (str): Target GraphDB repository.
+            mime_type (str): RDF MIME type shared by all files.
+            context (str, optional): IRI of the named graph to load the triples into.
+
+        Returns:
+            bool: True if the batch was uploaded.
+        """
+        if not self._ensure_connected(): return False
+        if not self.check_connection(repository): return False
+
+        missing = [path for path in file_paths if not os.path.exists(path)]
+        if missing:
+            logger.error(f"Files not found: {missing}")
+            return False
+
+        try:
+            chunks = []
+            for path in file_paths:
+                with open(path, 'rb') as f:
+                    chunks.append(f.read())
+
+            url = urljoin(self.graphdb_url + '/', f"repositories/{repository}/statements")
+            logger.info(f"Uploading {len(file_paths)} file(s) to repository '{repository}' in one batch as {mime_type}...")
+
+            response = requests.post(url, data=b"\n".join(chunks), headers={'Content-Type': mime_type},
+                                     params=self._context_params(context))
+
+            if 200 <= response.status_code < 300:
+                logger.info("Batch upload successful.")
+                return True
+            else:
+                logger.error(f"Batch upload failed with status {response.status_code}: {response.text}")
+                return False
+
+        except Exception as e:
+            logger.error(f"Failed to upload files: {e}")
+            return False
+
+    def replace_graphs(self, graph_files: dict, repository: str, mime_type: str = "text/turtle") -> bool:
+        """
+        Replace several named graphs with the content of the given files in one transaction.
+
+        Every graph is cleared and reloaded, so statements removed from a source since its
+        last load disappear as well. Either all graphs are replaced or none is.
+
+        Args:
+            graph_files (dict): Maps named graph IRIs to the RDF file holding their new content.
+            repository (str): Target GraphDB repository.
+            mime_type (str): RDF MIME type shared by all files.
+
+        Returns:
+            bool: True if the transaction was committed.
+        """
+        if not self._ensure_connected(): return False
+        if not self.check_connection(repository): return False
+
+        missing = [path for path in graph_files.values() if not os.path.exists(path)]
+        if missing:
+            logger.error(f"Files not found: {missing}")
+            return False
+
+        transaction_url = None
+        try:
+            url = urljoin(self.graphdb_url + '/', f"repositories/{repository}/transactions")
+            response = requests.post(url)
+            response.raise_for_status()
+            transaction_url = response.headers['Location']
+
+            logger.info(f"Replacing {len(graph_files)} graph(s) in repository '{repository}' in one transaction...")
+            clear = "; ".join(f"CLEAR SILENT GRAPH <{graph}>" for graph in graph_files)
+            response = requests.put(transaction_url, params={'action': 'UPDATE'}, data=clear.encode('utf-8'),
+                                    headers={'Content-Type': 'application/sparql-update'})
+            response.raise_for_status()
+
+            for graph, path in graph_files.items():
+                with open(path, 'rb') as f:
+                    response = requests.put(transaction_url, params={'action': 'ADD', **self._context_params(graph)},
+                                            data=f.read(), headers={'Content-Type': mime_type})
+                response.raise_for_status()
+
+            response = requests.put(transaction_url, params={'action': 'COMMIT'})
+            response.raise_for_status()
+            logger.info("Graph replacement committed.")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to replace graphs: {e}")
+            if transaction_url:
+                try:
+                    requests.delete(transaction_url)  # Roll back
+                except Exception:
+                    pass
+            return False
+
+    def import_files(self, file_paths: list[str], repository: str, import_directory: str = None,
+                     poll_interval: float = 2.0, timeout: float = 3600.0, contexts: dict = None) -> list[str]:
+        """
+        Bulk-load RDF files through GraphDB's server-side import.
+
+        The files are copied into the shared import directory and GraphDB is asked to
+        import them from there, which avoids pushing the data through the HTTP API.
+        Falls back to `upload_file` when no shared import directory is available. The
+        repository must already exist; callers check it with `check_connection` first.
+
+        Args:
+            file_paths (list[str]): Paths to RDF files (e.g., .ttl, .rdf, .nt)
+            repository (str): Target GraphDB repository.
+            import_directory (str, optional): Overrides the import directory given to `connect`.
+            poll_interval (float): Seconds to wait between import status checks.
+            timeout (float): Maximum number of seconds to wait for the import to finish.
+            contexts (dict, optional): Maps file paths to the named graph each one replaces.
+
+        Returns:
+            list[str]: The file paths that were imported successfully.
+        """
+        if not self._ensure_connected(): return []
+
+        contexts = contexts or {}
+
+        def fallback(paths):
+            return [path for path in paths
+                    if self.upload_file(path, repository, context=contexts.get(path), replace=path in contexts)]
+
+        import_directory = import_directory or self.import_directory
+        if not import_directory or not os.path.isdir(import_directory):
+            logger.warning("Shared import directory not available. Falling back to HTTP upload.")
+            return fallback(file_paths)
+
+        # Stage each batch in its own folder so stale statuses of earlier imports
+        # with the same file names are not mistaken for this one.
+        batch_dir = os.path.join(import_directory, f"kgtoolkit-{uuid.uuid4().hex}")
+        staged = {}
+        in_progress = False
+
+        try:
+            os.makedirs(batch_dir)
+            for path in file_paths:
+                if not os.path.exists(path):
+                    logger.error(f"File not found: {path}")
+                    continue
+                shutil.copy2(path, batch_dir)
+                server_name = f"{os.path.basename(batch_dir)}/{os.path.basename(path)}"
+                staged[server_name] = path
+
+            if not staged:
+                return []
+
+            url = urljoin(self.graphdb_url + '/', f"rest/repositories/{repository}/import/server")
+            logger.info(f"Starting server-side import of {len(staged)} file(s) into repository '{repository}'...")
+
+            # Files loaded into their own graph need their own import settings
+            if contexts:
+                requests_to_send = [([name], {"context": contexts[path], "replaceGraphs": [contexts[path]]})
+                                    for name, path in staged.items() if path in contexts]
+                requests_to_send += [([name for name, path in staged.items() if path not in contexts], {})]
+            else:
+                requests_to_send = [(list(staged), {})]
+
+            fallen_back = []
+            for names, settings in requests_to_send:
+                if not names:
+                    continue
+                response = requests.post(url, json={"fileNames": names, "importSettings": settings})
+                if 200 <= response.status_code < 300:
+                    # GraphDB may now be reading the staged files, so they are only
+                    # removed once every import is known to have finished.
+                    in_progress = True
+                    continue
+                logger.error(f"Server-side import request failed with status {response.status_code}: {response.text}")
+                logger.warning("Falling back to HTTP upload.")
+                for name in names:
+                    fallen_back += fallback([staged.pop(name)])
+
+            if not staged:
+                return fallen_back
+
+            statuses = self._wait_for_import(repository, list(staged), poll_interval, timeout)
+
+            imported = fallen_back
+            in_progress = False
+            for server_name, path in staged.items():
+                status, message = statuses.get(server_name, ("PENDING", ""))
+                if status == "DONE":
+                    imported.append(path)
+                elif status != "ERROR":
+                    in_progress = True
+                    logger.warning(f"Import of '{path}' is still {status}; leaving it staged in {batch_dir}.")
+                else:
+                    logger.error(f"Import of '{path}' ended with status {status}: {message}")
+
+            logger.info(f"Server-side import finished: {len(imported)}/{len(staged)} file(s) imported.")
+            return imported
+
+        except Exception as e:
+            logger.error(f"Server-side import failed: {e}")
+            if in_progress:
+                logger.warning(f"Leaving the staged files in {batch_dir} as GraphDB may still be importing them.")
+            return []
+
+        finally:
+            if not in_progress:
+                shutil.rmtree(batch_dir, ignore_errors=True)
+
+    def switch_ruleset(self, repository: str, ruleset: str, reinfer: bool = True) -> bool:
+        """
+        Change the ruleset of an existing repository and optionally recompute inferences.
+
+        Meant to be called once after a load into a repository created with the
+        `bulk-load` profile, so inference runs over the complete data set only once.
+
+        Args:
+            repository (str): Target repository.
+            ruleset (str): Name of the ruleset to switch to (e.g., owl-horst-optimized).
+            reinfer (bool): Whether to recompute the inferred closure afterwards.
+
+        Returns:
+            bool: True if all updates succeeded.
+        """
+        if not self._ensure_connected(): return False
+
+        updates = [
+            f'PREFIX sys: <{SYSTEM_NS}> INSERT DATA {{ _:b sys:addRuleset "{ruleset}" }}',
+            f'PREFIX sys: <{SYSTEM_NS}> INSERT DATA {{ _:b sys:defaultRuleset "{ruleset}" }}',
+        ]
+        if reinfer:
+            updates.append(f'PREFIX sys: <{SYSTEM_NS}> INSERT DATA {{ [] sys:reinfer [] }}')
+
+        url = urljoin(self.graphdb_url + '/', f"repositories/{repository}/statements")
+        headers = {'Content-Type': 'application/sparql-update'}
+
+        try:
+            logger.info(f"Switching repository '{repository}' to ruleset '{ruleset}'...")
+            for update in updates:
+                response = requests.post(url, data=update.encode('utf-8'), headers=headers)
+                response.raise_for_status()
+
+            if reinfer:
+                logger.info(f"Reinference on repository '{repository}' completed.")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to switch ruleset of repository '{repository}': {e}")
+            return False
+
+    def execute_sparql_query(self, query: str, repository: str, accept: str = None) -> str | None:
         """
         Run a SPARQL query against the specified repository and return result.
 
         Args:
             query (str): SPARQL query string.
             repository (str): Target repository.
+            accept (str, optional): Result MIME type to request instead of Turtle.
 
         Returns:
             str: Query result in TTL format.
@@ -123,7 +496,8 @@ class DatabaseManager:
 
         try:
             url = urljoin(self.graphdb_url + '/', f"repositories/{repository}")
-            response = requests.post(url, data=query, headers=self.query_headers)
+            headers = {**self.query_headers, 'Accept': accept} if accept else self.query_headers
+            response = requests.post(url, data=query, headers=headers)
             response.raise_for_status()
             logger.info("SPARQL query executed successfully.")
             return response.text
@@ -132,6 +506,110 @@ class DatabaseManager:
             logger.error(f"SPARQL query failed: {e}")
             return None
 
+    def export_query(self, query: str, repository: str, output_path: str, rdf_format: str = "turtle",
+                     compress: bool = False) -> bool:
+        """
+        Run a CONSTRUCT or DESCRIBE query and stream its result into a file.
+
+        Unlike `execute_sparql_query`, the result is written as it arrives and never
+        held in memory as a whole.
+
+        Args:
+            query (str): SPARQL CONSTRUCT/DESCRIBE query string.
+            repository (str): Target repository.
+            output_path (str): File to write the result to.
+            rdf_format (str): Key of `EXPORT_FORMATS` to request the result in.
+            compress (bool): Gzip the output file.
+
+        Returns:
+            bool: True if the result was written completely.
+        """
+        if not self._ensure_connected(): return False
+
+        if rdf_format not in EXPORT_FORMATS:
+            logger.error(f"Unknown export format '{rdf_format}'. Available: {', '.join(EXPORT_FORMATS)}")
+            return False
+
+        url = urljoin(self.graphdb_url + '/', f"repositories/{repository}")
+        headers = {'Content-Type': 'application/sparql-query', 'Accept': EXPORT_FORMATS[rdf_format][0]}
+        return self._download(url, output_path, compress, data=query.encode('utf-8'), headers=headers,
+                              params={'infer': 'false'}, method='post')
+
+    def export_repository(self, repository: str, output_dir: str, rdf_format: str = "turtle",
+                          compress: bool = False, partition: str = "graph", partitions: int = 4,
+                          workers: int = 4) -> list[str]:
+        """
+        Export the explicit statements of a repository into RDF files, in parallel.
+
+        With `partition="graph"` every named graph (and the default graph) is fetched
+        into its own file. With `partition="subject"` the statements are split into
+        `partitions` files by a hash of their subject, which also spreads repositories
+        that keep everything in one graph. Each partition is streamed to disk by its
+        own request, so memory use does not grow with the repository size.
+
+        Partitioning by subject runs one CONSTRUCT per part. CONSTRUCT results carry no
+        graph membership, so quad formats (nquads, trig) are rejected in that mode. Each
+        part also scans the whole repository and hashes every subject, so N parts cost N
+        full scans; it trades server CPU for parallel transfer and bounded file sizes.
+        Blank node labels are only consistent within one file when partitioning by subject.
+
+        Args:
+            repository (str): Repository to export.
+            output_dir (str): Directory the files are written to. Created if missing.
+            rdf_format (str): Key of `EXPORT_FORMATS`.
+            compress (bool): Gzip the output files.
+            partition (str): "graph" or "subject".
+            partitions (int): Number of subject-hash partitions (1-16).
+            workers (int): Number of concurrent export requests.
+
+        Returns:
+            list[str]: Paths of the files written successfully.
+        """
+        if not self._ensure_connected(): return []
+
+        if rdf_format not in EXPORT_FORMATS:
+            logger.error(f"Unknown export format '{rdf_format}'. Available: {', '.join(EXPORT_FORMATS)}")
+            return []
+
+        if workers < 1:
+            logger.error("At least one export worker is required.")
+            return []
+
+        mime_type, extension = EXPORT_FORMATS[rdf_format]
+        extension += ".gz" if compress else ""
+        os.makedirs(output_dir, exist_ok=True)
+
+        if partition == "graph":
+            graphs = self._list_graphs(repository)
+            if graphs is None:
+                return []
+            tasks = [self._graph_export_task(repository, graph, output_dir, extension, mime_type)
+                     for graph in [None] + graphs]
+        elif partition == "subject":
+            if rdf_format in QUAD_FORMATS:
+                logger.error(f"Format '{rdf_format}' keeps named graphs, which a subject partition loses. "
+                             "Use partition='graph' or a triple format.")
+                return []
+            if not 1 <= partitions <= 16:
+                logger.error("Subject partitioning supports between 1 and 16 partitions.")
+                return []
+            tasks = [self._subject_export_task(repository, index, partitions, output_dir, extension, mime_type)
+                     for index in range(partitions)]
+        else:
+            logger.error(f"Unknown partitioning '{partition}'. Use 'graph' or 'subject'.")
+            return []
+
+        logger.info(f"Exporting repository '{repository}' in {len(tasks)} partition(s) with {workers} worker(s)...")
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(
+                lambda task: self._download(task["url"], task["path"], compress, **task["request"]), tasks
+            ))
+
+        exported = [task["path"] for task, ok in zip(tasks, results) if ok]
+        logger.info(f"Exported {len(exported)}/{len(tasks)} partition(s) to '{output_dir}'.")
+        return exported
+
     def backup_repository(self, repository: str) -> dict | None:
         """
         Initiate a backup of the specified repository.
@@ -192,47 +670,170 @@ class DatabaseManager:
             logger.error(f"Restore failed: {e}")
             return False
 
-    def _create_repository(self, repository: str) -> bool:
+    def _create_repository(self, repository: str, profile: str = "default") -> bool:
         """
-        Create a new repository with default settings if it does not exist.
+        Create a new repository using the given provisioning profile.
 
         Args:
             repository (str): Name of the repository to create.
+            profile (str): Key of `REPOSITORY_PROFILES` to take the repository parameters from.
 
         Raises:
             GraphDBException: If creation fails.
         """
-        repo_config = f"""
-        #
-        # Auto-generated configuration for repository: {repository}
-        #
-        <?xml version="1.0" encoding="UTF-8" standalone="no"?>
-        <Repository>
-            <id>{repository}</id>
-            <title>{repository}</title>
-            <type>graphdb:FreeSailRepository</type>
-            <params>
-                <RepositoryParams xmlns="http://www.ontotext.com/trree/graphdb">
-                    <param name="repositoryId">{repository}</param>
-                    <param name="ruleset">owl-horst-optimized</param>
-                    <param name="storage-folder">{repository}</param>
-                </RepositoryParams>
-            </params>
-        </Repository>
-        """.strip()
+        if profile not in REPOSITORY_PROFILES:
+            logger.error(f"Unknown repository profile '{profile}'. Available: {', '.join(REPOSITORY_PROFILES)}")
+            return False
+
+        params = "".join(
+            f'            graphdb:{name} "{value}" ;\n'
+            for name, value in REPOSITORY_PROFILES[profile].items()
+        )
+
+        # Auto-generated Turtle configuration, as accepted by GraphDB's repository REST API
+        repo_config = (
+            "@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .\n"
+            "@prefix rep: <http://www.openrdf.org/config/repository#> .\n"
+            "@prefix sr: <http://www.openrdf.org/config/repository/sail#> .\n"
+            "@prefix sail: <http://www.openrdf.org/config/sail#> .\n"
+            "@prefix graphdb: <http://www.ontotext.com/config/graphdb#> .\n"
+            "\n"
+            "[] a rep:Repository ;\n"
+            f'    rep:repositoryID "{repository}" ;\n'
+            f'    rdfs:label "{repository}" ;\n'
+            "    rep:repositoryImpl [\n"
+            '        rep:repositoryType "graphdb:SailRepository" ;\n'
+            "        sr:sailImpl [\n"
+            '            sail:sailType "graphdb:Sail" ;\n'
+            f"{params}"
+            '            graphdb:storage-folder "storage"\n'
+            "        ]\n"
+            "    ] .\n"
+        )
 
         url = urljoin(self.graphdb_url + '/', 'rest/repositories')
-        headers = {'Content-Type': 'application/xml'}
+        files = {'config': (f"{repository}-config.ttl", repo_config.encode('utf-8'), 'text/turtle')}
 
         try:
-            requests.post(url, data=repo_config.encode('utf-8'), headers=headers)
-        except Exception:
-            logger.error(f"Failed to create repository '{repository}'.")
+            response = requests.post(url, files=files)
+        except Exception as e:
+            logger.error(f"Failed to create repository '{repository}': {e}")
+            return False
+
+        if not 200 <= response.status_code < 300:
+            logger.error(f"Failed to create repository '{repository}' with status {response.status_code}: {response.text}")
             return False
 
-        logger.info(f"Repository '{repository}' created successfully.")
+        logger.info(f"Repository '{repository}' created successfully with profile '{profile}'.")
         return True
 
+    def _wait_for_import(self, repository: str, server_names: list[str], poll_interval: float,
+                         timeout: float) -> dict:
+        """
+        Poll the server-side import status until the given files are finished.
+
+        Args:
+            repository (str): Repository the import runs against.
+            server_names (list[str]): File names relative to the import directory.
+            poll_interval (float): Seconds to wait between status checks.
+            timeout (float): Maximum number of seconds to wait.
+
+        Returns:
+            dict: Maps each file name to a `(status, message)` tuple.
+        """
+        url = urljoin(self.graphdb_url + '/', f"rest/repositories/{repository}/import/server")
+        deadline = time.monotonic() + timeout
+        statuses = {}
+
+        while True:
+            response = requests.get(url)
+            response.raise_for_status()
+
+            for entry in response.json():
+                if entry.get("name") in server_names:
+                    statuses[entry["name"]] = (entry.get("status"), entry.get("message", ""))
+
+            pending = [name for name in server_names
+                       if statuses.get(name, ("PENDING",))[0] not in ("DONE", "ERROR")]
+            if not pending:
+                return statuses
+
+            if time.monotonic() >= deadline:
+                logger.error(f"Timed out waiting for server-side import of {len(pending)} file(s).")
+                return statuses
+
+            time.sleep(poll_interval)
+
+    def _list_graphs(self, repository: str) -> list[str] | None:
+        """Return the IRIs of the named graphs in the repository."""
+        url = urljoin(self.graphdb_url + '/', f"repositories/{repository}/contexts")
+        try:
+            response = requests.get(url, headers={'Accept': 'application/sparql-results+json'})
+            response.raise_for_status()
+            return [binding["contextID"]["value"] for binding in response.json()["results"]["bindings"]]
+        except Exception as e:
+            logger.error(f"Failed to list graphs of repository '{repository}': {e}")
+            return None
+
+    def _graph_export_task(self, repository: str, graph: str | None, output_dir: str, extension: str,
+                           mime_type: str) -> dict:
+        if graph is None:
+            name, context = "default", "null"
+        else:
+            # Readable file name that stays unique for graphs with similar IRIs
+            slug = re.sub(r'[^A-Za-z0-9._-]+', '_', graph)[-80:].strip('_')
+            name, context = f"{slug}-{hashlib.md5(graph.encode('utf-8')).hexdigest()[:8]}", f"<{graph}>"
+
+        return {
+            "url": urljoin(self.graphdb_url + '/', f"repositories/{repository}/statements"),
+            "path": os.path.join(output_dir, f"{name}.{extension}"),
+            "request": {
+                "headers": {'Accept': mime_type},
+                "params": {'context': context, 'infer': 'false'},
+            },
+        }
+
+    def _subject_export_task(self, repository: str, index: int, partitions: int, output_dir: str,
+                             extension: str, mime_type: str) -> dict:
+        # Subjects are assigned by the first hex digit of the MD5 of their IRI
+        digits = ", ".join(f'"{digit:x}"' for digit in range(16) if digit % partitions == index)
+        condition = f"!isBlank(?s) && SUBSTR(MD5(STR(?s)), 1, 1) IN ({digits})"
+        if index == 0:
+            condition = f"isBlank(?s) || ({condition})"
+
+        query = f"CONSTRUCT {{ ?s ?p ?o }} WHERE {{ ?s ?p ?o FILTER({condition}) }}"
+        return {
+            "url": urljoin(self.graphdb_url + '/', f"repositories/{repository}"),
+            "path": os.path.join(output_dir, f"part-{index:02d}.{extension}"),
+            "request": {
+                "method": "post",
+                "data": query.encode('utf-8'),
+                "headers": {'Content-Type': 'application/sparql-query', 'Accept': mime_type},
+                "params": {'infer': 'false'},
+            },
+        }
+
+    def _download(self, url: str, output_path: str, compress: bool, method: str = "get", **kwargs) -> bool:
+        """Stream an HTTP response body into a (optionally gzipped) file."""
+        opener = gzip.open if compress else open
+        try:
+            with requests.request(method, url, stream=True, **kwargs) as response:
+                response.raise_for_status()
+                with opener(output_path, 'wb') as file:
+                    for chunk in response.iter_content(chunk_size=1 << 20):
+                        file.write(chunk)
+            logger.info(f"Exported '{output_path}'.")
+            return True
+        except Exception as e:
+            logger.error(f"Export to '{output_path}' failed: {e}")
+            if os.path.exists(output_path):
+                os.remove(output_path)  # Do not leave a truncated file behind
+            return False
+
+    def _context_params(self, context: str | None) -> dict:
+        """Request parameters that direct uploaded statements into a named graph."""
+        return {'context': f"<{context}>"} if context else {}
+
     def _ensure_connected(self) -> bool:
         """Raise an exception if not connected to GraphDB."""
         if not self.connected or not self.graphdb_url:
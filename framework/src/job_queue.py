@@ -0,0 +1,203 @@
+import json
+import time
+import sqlite3
+from contextlib import contextmanager
+from logging_config import LoggingConfig
+
+logger = LoggingConfig.setup("job_queue")
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+class JobQueue:
+    def __init__(self, db_path: str = "jobs.db", max_attempts: int = 3):
+        """
+        Durable queue of plugin-run jobs backed by a SQLite database.
+
+        Every operation opens its own connection, so one queue file can be shared by
+        worker threads, processes, and hosts mounting the same filesystem (provided the
+        filesystem supports SQLite's file locking).
+
+        Args:
+            db_path (str): Path to the SQLite database file. Created if missing.
+            max_attempts (int): How many times a job is leased before it is marked failed.
+        """
+        self.db_path = db_path
+        self.max_attempts = max_attempts
+        self._create_schema()
+
+    def enqueue(self, plugin_name: str, input_path: str, graphdb_url: str, params: dict = None) -> int:
+        """
+        Add a plugin run to the queue.
+
+        Returns:
+            int: ID of the new job.
+        """
+        now = time.time()
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "INSERT INTO jobs (plugin, input, graphdb, params, status, attempts, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, 0, ?, ?)",
+                (plugin_name, input_path, graphdb_url, json.dumps(params or {}), QUEUED, now, now),
+            )
+            job_id = cursor.lastrowid
+        logger.info(f"Enqueued job {job_id}: plugin '{plugin_name}' on '{input_path}'")
+        return job_id
+
+    def claim(self, worker_id: str, lease_seconds: float) -> dict | None:
+        """
+        Lease the oldest queued job to a worker.
+
+        Jobs whose lease ran out (their worker died or stopped heart-beating) are
+        re-queued first.
+
+        Returns:
+            dict: The claimed job, or None if the queue is empty.
+        """
+        with self._connect(transaction=True) as conn:
+            self._requeue_expired(conn)
+            row = conn.execute(
+                "SELECT * FROM jobs WHERE status = ? ORDER BY id LIMIT 1", (QUEUED,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            now = time.time()
+            conn.execute(
+                "UPDATE jobs SET status = ?, worker = ?, lease_expires = ?, attempts = attempts + 1, "
+                "updated_at = ? WHERE id = ?",
+                (RUNNING, worker_id, now + lease_seconds, now, row["id"]),
+            )
+
+        return self.get(row["id"])
+
+    def heartbeat(self, job_id: int, worker_id: str, lease_seconds: float) -> bool:
+        """
+        Extend the lease of a running job.
+
+        Returns:
+            bool: False if the worker no longer holds the lease.
+        """
+        now = time.time()
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET lease_expires = ?, updated_at = ? WHERE id = ? AND worker = ? AND status = ?",
+                (now + lease_seconds, now, job_id, worker_id, RUNNING),
+            )
+        return cursor.rowcount == 1
+
+    def complete(self, job_id: int, worker_id: str, result) -> bool:
+        """Mark a job as done and store its JSON-serialisable result."""
+        return self._finish(job_id, worker_id, DONE, result=json.dumps(result))
+
+    def fail(self, job_id: int, worker_id: str, error: str) -> bool:
+        """Mark a job as failed and store the error message."""
+        return self._finish(job_id, worker_id, FAILED, error=error)
+
+    def requeue_expired(self) -> int:
+        """
+        Re-queue running jobs whose lease has expired.
+
+        Returns:
+            int: Number of jobs put back on the queue or given up on.
+        """
+        with self._connect(transaction=True) as conn:
+            return self._requeue_expired(conn)
+
+    def get(self, job_id: int) -> dict | None:
+        """Return the job with the given ID, or None if it does not exist."""
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._to_dict(row) if row else None
+
+    def list_jobs(self, status: str = None) -> list[dict]:
+        """Return all jobs, optionally filtered by status."""
+        with self._connect() as conn:
+            if status:
+                rows = conn.execute("SELECT * FROM jobs WHERE status = ? ORDER BY id", (status,)).fetchall()
+            else:
+                rows = conn.execute("SELECT * FROM jobs ORDER BY id").fetchall()
+        return [self._to_dict(row) for row in rows]
+
+    def _finish(self, job_id: int, worker_id: str, status: str, result: str = None, error: str = None) -> bool:
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, lease_expires = NULL, updated_at = ? "
+                "WHERE id = ? AND worker = ? AND status = ?",
+                (status, result, error, time.time(), job_id, worker_id, RUNNING),
+            )
+        if cursor.rowcount != 1:
+            logger.warning(f"Worker '{worker_id}' lost the lease on job {job_id}; result discarded.")
+            return False
+        return True
+
+    def _requeue_expired(self, conn) -> int:
+        """Requeue or fail expired jobs. Must be called inside a write transaction."""
+        now = time.time()
+        failed = conn.execute(
+            "UPDATE jobs SET status = ?, error = ?, lease_expires = NULL, updated_at = ? "
+            "WHERE status = ? AND lease_expires < ? AND attempts >= ?",
+            (FAILED, "Lease expired too many times.", now, RUNNING, now, self.max_attempts),
+        ).rowcount
+        requeued = conn.execute(
+            "UPDATE jobs SET status = ?, worker = NULL, lease_expires = NULL, updated_at = ? "
+            "WHERE status = ? AND lease_expires < ?",
+            (QUEUED, now, RUNNING, now),
+        ).rowcount
+        if failed or requeued:
+            logger.warning(f"Expired leases: {requeued} job(s) re-queued, {failed} job(s) failed.")
+        return failed + requeued
+
+    @contextmanager
+    def _connect(self, transaction: bool = False):
+        """
+        Open a connection for a single operation.
+
+        With `transaction=True` the block runs in a write transaction that is taken
+        up front, so concurrent workers cannot claim the same job.
+        """
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            if transaction:
+                conn.execute("BEGIN IMMEDIATE")
+            yield conn
+            if transaction:
+                conn.execute("COMMIT")
+        except Exception:
+            if transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def _create_schema(self):
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    plugin TEXT NOT NULL,
+                    input TEXT,
+                    graphdb TEXT,
+                    params TEXT,
+                    status TEXT NOT NULL,
+                    worker TEXT,
+                    lease_expires REAL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    result TEXT,
+                    error TEXT,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status)")
+
+    def _to_dict(self, row) -> dict:
+        job = dict(row)
+        job["params"] = json.loads(job["params"]) if job["params"] else {}
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        return job
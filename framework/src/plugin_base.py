@@ -9,18 +9,28 @@ class PluginBase(ABC):
     such as the database manager.
     """
 
+    # Set to True by plugins that implement `stream`
+    supports_streaming = False
+
+    # MIME type of the chunks produced by `stream`
+    stream_mime_type = "text/turtle"
+
     def __init__(self):
         self.database_manager = None
+        self.checkpoint = None
 
-    def set_managers(self, *, database_manager=None):
+    def set_managers(self, *, database_manager=None, checkpoint=None):
         """
         Inject external shared managers (e.g., DatabaseManager) into the plugin instance.
 
         Args:
             database_manager (DatabaseManager, optional): Instance of a database manager
                 that allows the plugin to interact with a backend repository.
+            checkpoint (CheckpointJournal, optional): Journal of the current run, used to
+                record finished work and to skip it when the run is resumed.
         """
         self.database_manager = database_manager
+        self.checkpoint = checkpoint
 
     @abstractmethod
     def run(self, params: dict) -> str:
@@ -35,6 +45,27 @@ class PluginBase(ABC):
         """
         pass
 
+    def stream(self, params: dict):
+        """
+        Optionally produce the plugin's RDF output as a stream instead of files.
+
+        Plugins that implement this method set `supports_streaming = True` and can then be
+        run with `stream=True`, in which case the framework sends the chunks straight to the
+        database without a disk round trip. Each source document is uploaded as its own
+        request, so a sharded database can place it independently of the others.
+
+        Args:
+            params (dict): Runtime parameters for the plugin execution.
+
+        Returns:
+            Iterator[tuple[str, str | None, Iterator[str | bytes]]] | None: One
+                `(source, graph, chunks)` tuple per source document, where `chunks` are the
+                consecutive pieces of an RDF document in `stream_mime_type` and `graph` is the
+                named graph it replaces (or None to add to the default graph). None if the
+                plugin does not support streaming.
+        """
+        return None
+
     @abstractmethod
     def info(self) -> dict:
         """
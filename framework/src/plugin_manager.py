@@ -78,12 +78,21 @@ class PluginManager:
             del self._loaded_plugins[plugin_name]
             logger.info(f"Unloaded plugin '{plugin_name}'")
 
-    def run_plugin(self, plugin_name: str, input_path: str) -> str:
+    def run_plugin(self, plugin_name: str, params: dict) -> str:
         if not self.is_loaded(plugin_name):
             raise RuntimeError(f"Plugin '{plugin_name}' is not loaded.")
         plugin = self._loaded_plugins[plugin_name]
         logger.info(f"Running plugin '{plugin_name}'...")
-        return plugin.run(input_path)
+        return plugin.run(params)
+
+    def stream_plugin(self, plugin_name: str, params: dict):
+        if not self.is_loaded(plugin_name):
+            raise RuntimeError(f"Plugin '{plugin_name}' is not loaded.")
+        plugin = self._loaded_plugins[plugin_name]
+        if not plugin.supports_streaming:
+            raise RuntimeError(f"Plugin '{plugin_name}' does not support streaming.")
+        logger.info(f"Streaming plugin '{plugin_name}'...")
+        return plugin.stream(params)
 
     def list_available_plugins(self) -> list[str]:
         return list(self._available_plugins.keys())
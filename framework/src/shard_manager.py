@@ -0,0 +1,230 @@
+import os
+import re
+import json
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from logging_config import LoggingConfig
+from framework.src.database_manager import DatabaseManager
+
+logger = LoggingConfig.setup("shard_manager")
+
+SHARD_STRATEGIES = ("source", "graph")
+
+# Result MIME types a federated query can merge
+SELECT_RESULTS = 'application/sparql-results+json'
+GRAPH_RESULTS = ('application/n-triples', 'text/turtle')
+
+_DISTINCT = re.compile(r'\bSELECT\s+(DISTINCT|REDUCED)\b', re.IGNORECASE)
+
+class ShardManager:
+    def __init__(self, shards: list[str], strategy: str = "source"):
+        """
+        Spread writes over several GraphDB instances or repositories and federate reads.
+
+        Provides the upload, query and repository methods of DatabaseManager, so it can be
+        injected into plugins in its place. Every write goes to exactly one shard, chosen
+        by a stable hash of its source file name or of its named graph. Read queries run
+        against all shards in parallel and their results are merged.
+
+        Args:
+            shards (list[str]): GraphDB URLs. A URL may name the repository to use on that
+                instance (e.g., http://host:7200/repositories/network); otherwise the
+                repository passed to each call is used.
+            strategy (str): "source" to hash by input file name without its extension,
+                "graph" to hash by named graph.
+        """
+        if not shards:
+            raise ValueError("At least one shard is required.")
+        if strategy not in SHARD_STRATEGIES:
+            raise ValueError(f"Unknown shard strategy '{strategy}'. Use one of: {', '.join(SHARD_STRATEGIES)}")
+
+        self.strategy = strategy
+        self._shards = []  # (DatabaseManager, repository or None)
+        for url in shards:
+            base_url, _, repository = url.rstrip('/').partition('/repositories/')
+            manager = DatabaseManager()
+            manager.connect(base_url)
+            self._shards.append((manager, repository or None))
+
+        logger.info(f"Sharding over {len(self._shards)} shard(s) by {strategy}.")
+
+    def shard_index(self, key: str) -> int:
+        """Return the index of the shard responsible for the given source or graph key."""
+        return int(hashlib.md5(key.encode('utf-8')).hexdigest(), 16) % len(self._shards)
+
+    def check_connection(self, repository: str, profile: str = "default") -> bool:
+        return all(self._on_all(lambda manager, repo: manager.check_connection(repo, profile), repository))
+
+    def upload_file(self, file_path: str, repository: str, mime_type: str = "text/turtle",
+                    context: str = None, replace: bool = False) -> bool:
+        manager, repo = self._shard_for(self._key(file_path, context), repository)
+        return manager.upload_file(file_path, repo, mime_type, context, replace)
+
+    def upload_files(self, file_paths: list[str], repository: str, mime_type: str = "text/turtle",
+                     context: str = None) -> bool:
+        """Upload the files as one batch per shard, with the shards written in parallel."""
+        groups = {}
+        for path in file_paths:
+            groups.setdefault(self.shard_index(self._key(path, context)), []).append(path)
+
+        def upload(index):
+            manager, repo = self._shards[index]
+            return manager.upload_files(groups[index], repo or repository, mime_type, context)
+
+        with ThreadPoolExecutor(max_workers=len(groups) or 1) as executor:
+            return all(executor.map(upload, groups))
+
+    def upload_stream(self, chunks, repository: str, mime_type: str = "text/turtle", tee=None,
+                      source: str = None, context: str = None, replace: bool = False) -> bool:
+        # A stream is a single document, so all of it goes to the shard of its source or graph
+        manager, repo = self._shard_for(self._key(source or repository, context), repository)
+        return manager.upload_stream(chunks, repo, mime_type, tee, source, context, replace)
+
+    def replace_graphs(self, graph_files: dict, repository: str, mime_type: str = "text/turtle") -> bool:
+        """Replace the graphs with one transaction per shard, with the shards written in parallel."""
+        groups = {}
+        for graph, path in graph_files.items():
+            groups.setdefault(self.shard_index(self._key(path, graph)), {})[graph] = path
+
+        def replace(index):
+            manager, repo = self._shards[index]
+            return manager.replace_graphs(groups[index], repo or repository, mime_type)
+
+        with ThreadPoolExecutor(max_workers=len(groups) or 1) as executor:
+            return all(executor.map(replace, groups))
+
+    def import_files(self, file_paths: list[str], repository: str, import_directory: str = None,
+                     poll_interval: float = 2.0, timeout: float = 3600.0, contexts: dict = None) -> list[str]:
+        """
+        Load the files through each shard's own import path.
+
+        Shards only share an import directory with the host they run on, so an explicit
+        `import_directory` is ignored and shards without one fall back to HTTP upload.
+        """
+        contexts = contexts or {}
+        groups = {}
+        for path in file_paths:
+            groups.setdefault(self.shard_index(self._key(path, contexts.get(path))), []).append(path)
+
+        def load(index):
+            manager, repo = self._shards[index]
+            return manager.import_files(groups[index], repo or repository, None, poll_interval, timeout, contexts)
+
+        with ThreadPoolExecutor(max_workers=len(groups) or 1) as executor:
+            return [path for imported in executor.map(load, groups) for path in imported]
+
+    def switch_ruleset(self, repository: str, ruleset: str, reinfer: bool = True) -> bool:
+        return all(self._on_all(lambda manager, repo: manager.switch_ruleset(repo, ruleset, reinfer), repository))
+
+    def execute_sparql_query(self, query: str, repository: str, accept: str = None) -> str | None:
+        """
+        Run a query on all shards and merge the results.
+
+        CONSTRUCT and DESCRIBE results are merged as graphs. Blank node labels are only
+        unique within one shard, so they are prefixed with the shard index first. With
+        `accept` set to SPARQL JSON, the query is merged as in `select` instead.
+
+        Args:
+            query (str): SPARQL query string.
+            repository (str): Repository to query on shards whose URL does not name one.
+            accept (str, optional): "application/sparql-results+json", or a graph format
+                ("application/n-triples" or "text/turtle"; the default).
+
+        Returns:
+            str: The deduplicated union of the shard results, as N-Triples (valid Turtle)
+                or SPARQL JSON, or None if any shard failed.
+        """
+        if accept == SELECT_RESULTS:
+            result = self.select(query, repository)
+            return json.dumps(result) if result is not None else None
+        if accept and accept not in GRAPH_RESULTS:
+            logger.error(f"Federated queries cannot merge '{accept}' results.")
+            return None
+
+        results = self._on_all(
+            lambda manager, repo: manager.execute_sparql_query(query, repo, accept='application/n-triples'),
+            repository,
+        )
+        if any(result is None for result in results):
+            logger.error("Federated query failed on at least one shard.")
+            return None
+
+        lines = dict.fromkeys(
+            self._rename_blank_nodes(line, index)
+            for index, result in enumerate(results)
+            for line in result.splitlines() if line.strip()
+        )
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def select(self, query: str, repository: str, distinct: bool = None) -> dict | None:
+        """
+        Run a SELECT or ASK query on all shards and merge the results.
+
+        Rows are concatenated (and deduplicated with `distinct`); ORDER BY, LIMIT and
+        aggregates are applied per shard, not over the merged result. Blank node values
+        are prefixed with the shard index, as their labels are only unique per shard.
+
+        Args:
+            query (str): SPARQL SELECT or ASK query string.
+            repository (str): Repository to query on shards whose URL does not name one.
+            distinct (bool, optional): Drop duplicate rows across shards. Defaults to
+                whether the query is a SELECT DISTINCT or SELECT REDUCED.
+
+        Returns:
+            dict: SPARQL JSON results, or None if any shard failed.
+        """
+        if distinct is None:
+            distinct = bool(_DISTINCT.search(query))
+
+        results = self._on_all(
+            lambda manager, repo: manager.execute_sparql_query(query, repo, accept=SELECT_RESULTS),
+            repository,
+        )
+        if any(result is None for result in results):
+            logger.error("Federated query failed on at least one shard.")
+            return None
+
+        results = [json.loads(result) for result in results]
+        if "boolean" in results[0]:
+            return {"head": {}, "boolean": any(result["boolean"] for result in results)}
+
+        variables = list(dict.fromkeys(var for result in results for var in result["head"].get("vars", [])))
+        bindings = [
+            {
+                var: {**value, "value": f"s{index}_{value['value']}"} if value.get("type") == "bnode" else value
+                for var, value in binding.items()
+            }
+            for index, result in enumerate(results)
+            for binding in result["results"]["bindings"]
+        ]
+        if distinct:
+            bindings = list({json.dumps(binding, sort_keys=True): binding for binding in bindings}.values())
+
+        return {"head": {"vars": variables}, "results": {"bindings": bindings}}
+
+    @staticmethod
+    def _rename_blank_nodes(line: str, index: int) -> str:
+        """Prefix the blank node labels of one N-Triples statement with a shard index."""
+        subject, predicate, rest = line.strip().split(None, 2)
+        if subject.startswith("_:"):
+            subject = f"_:s{index}_{subject[2:]}"
+        # Only a leading "_:" is a blank node; elsewhere in the object it is literal text
+        if rest.startswith("_:"):
+            rest = f"_:s{index}_{rest[2:]}"
+        return f"{subject} {predicate} {rest}"
+
+    def _key(self, file_path: str, context: str | None) -> str:
+        if self.strategy == "graph" and context:
+            return context
+        # Hash the source name only, without directory or extension, so a source maps to the
+        # same shard from any directory and whether its workbook is streamed or its file uploaded
+        return os.path.splitext(os.path.basename(file_path))[0]
+
+    def _shard_for(self, key: str, repository: str):
+        manager, repo = self._shards[self.shard_index(key)]
+        return manager, repo or repository
+
+    def _on_all(self, call, repository: str) -> list:
+        """Run `call(manager, repository)` on every shard in parallel."""
+        with ThreadPoolExecutor(max_workers=len(self._shards)) as executor:
+            return list(executor.map(lambda shard: call(shard[0], shard[1] or repository), self._shards))
@@ -0,0 +1,139 @@
+from array import array
+
+class TermStore:
+    """
+    Compact, deduplicated triple store for building RDF graphs in plugins.
+
+    IRIs and literals are interned once into integer IDs and every triple is kept as
+    three unsigned 32-bit IDs in typed arrays, instead of one Python object per edge.
+    Terms are only turned back into Turtle when the store is serialised.
+
+    Duplicates are not filtered on `add`. They are removed in one pass the next time the
+    triples are read (`triples`, `len`, `serialize`): the IDs are packed into 64-bit keys,
+    sorted and deduplicated, and the columns are rebuilt in (subject, predicate, object)
+    order. That pass briefly holds one Python int per triple.
+    """
+
+    def __init__(self):
+        self._prefixes = {}       # prefix -> namespace IRI
+        self._terms = []          # term ID -> serialised term
+        self._ids = {}            # serialised term -> term ID
+        self._subjects = array("I")
+        self._predicates = array("I")
+        self._objects = array("I")
+        self._compacted = 0       # number of leading triples known to be unique
+
+    def bind(self, prefix: str, namespace: str):
+        """Declare a prefix that may be used in `iri` and is written to the Turtle header."""
+        self._prefixes[prefix] = namespace
+
+    def iri(self, value: str) -> int:
+        """
+        Intern an IRI and return its ID.
+
+        Args:
+            value (str): A prefixed name using a bound prefix (e.g., "ex:Service"), or a full IRI.
+        """
+        prefix, separator, _ = value.partition(":")
+        return self._intern(value if separator and prefix in self._prefixes else f"<{value}>")
+
+    def literal(self, value, datatype: str = None, language: str = None) -> int:
+        """
+        Intern a literal and return its ID.
+
+        Args:
+            value (Any): Literal value; converted with `str`.
+            datatype (str, optional): Datatype IRI or prefixed name.
+            language (str, optional): Language tag. Ignored if a datatype is given.
+        """
+        text = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n").replace("\r", "\\r")
+        term = f'"{text}"'
+        if datatype:
+            term += "^^" + self._terms[self.iri(datatype)]
+        elif language:
+            term += f"@{language}"
+        return self._intern(term)
+
+    def add(self, subject: int, predicate: int, obj: int):
+        """Add a triple of term IDs. Duplicates are dropped when the store is next read."""
+        self._subjects.append(subject)
+        self._predicates.append(predicate)
+        self._objects.append(obj)
+
+    def term(self, term_id: int) -> str:
+        """Return the Turtle form of an interned term."""
+        return self._terms[term_id]
+
+    def triples(self):
+        """Iterate over the stored triples as `(subject, predicate, object)` ID tuples."""
+        self._compact()
+        return zip(self._subjects, self._predicates, self._objects)
+
+    def __len__(self) -> int:
+        self._compact()
+        return len(self._subjects)
+
+    def serialize(self, chunk_size: int = 10000):
+        """
+        Lazily serialise the store as a Turtle document.
+
+        Args:
+            chunk_size (int): Number of triples per yielded chunk.
+
+        Yields:
+            str: Consecutive chunks of the document, starting with the prefix declarations.
+        """
+        header = [f"@prefix {prefix}: <{namespace}> ." for prefix, namespace in self._prefixes.items()]
+        yield "\n".join(header) + "\n\n"
+
+        self._compact()
+        terms = self._terms
+        for start in range(0, len(self._subjects), chunk_size):
+            end = start + chunk_size
+            yield "".join(
+                f"{terms[s]} {terms[p]} {terms[o]} .\n"
+                for s, p, o in zip(self._subjects[start:end], self._predicates[start:end], self._objects[start:end])
+            )
+
+    def to_turtle(self) -> str:
+        """Serialise the whole store into one Turtle string."""
+        return "".join(self.serialize())
+
+    def _compact(self):
+        """Remove duplicate triples added since the last compaction."""
+        if self._compacted == len(self._subjects):
+            return
+
+        bits = max(1, (len(self._terms) - 1).bit_length())
+        if 3 * bits <= 64:
+            # Sorted packed keys: equal triples become neighbours
+            shift, mask = 2 * bits, (1 << bits) - 1
+            keys = sorted(
+                (s << shift) | (p << bits) | o
+                for s, p, o in zip(self._subjects, self._predicates, self._objects)
+            )
+            packed = array("Q")
+            previous = None
+            for key in keys:
+                if key != previous:
+                    packed.append(key)
+                    previous = key
+            del keys
+            self._subjects = array("I", (key >> shift for key in packed))
+            self._predicates = array("I", ((key >> bits) & mask for key in packed))
+            self._objects = array("I", (key & mask for key in packed))
+        else:
+            # Too many terms to pack three IDs into 64 bits; keep the first occurrence
+            unique = dict.fromkeys(zip(self._subjects, self._predicates, self._objects))
+            self._subjects = array("I", (s for s, _, _ in unique))
+            self._predicates = array("I", (p for _, p, _ in unique))
+            self._objects = array("I", (o for _, _, o in unique))
+        self._compacted = len(self._subjects)
+
+    def _intern(self, term: str) -> int:
+        term_id = self._ids.get(term)
+        if term_id is None:
+            term_id = len(self._terms)
+            self._terms.append(term)
+            self._ids[term] = term_id
+        return term_id
@@ -0,0 +1,85 @@
+import os
+import time
+from logging_config import LoggingConfig
+
+logger = LoggingConfig.setup("watch_manager")
+
+class WatchManager:
+    def __init__(self, input_path: str, extensions: tuple = (".xlsx",), interval: float = 1.0, debounce: float = 2.0):
+        """
+        Poll an input file or directory for new and modified files.
+
+        Args:
+            input_path (str): File or directory to watch.
+            extensions (tuple): File extensions that are considered inputs.
+            interval (float): Seconds between two scans of the input path.
+            debounce (float): Seconds without further changes before a batch is emitted.
+        """
+        self.input_path = input_path
+        self.extensions = extensions
+        self.interval = interval
+        self.debounce = debounce
+        self._running = False
+
+    def scan(self) -> dict:
+        """Return the modification signature of every matching input file."""
+        if os.path.isdir(self.input_path):
+            candidates = [os.path.join(self.input_path, fname) for fname in os.listdir(self.input_path)]
+        else:
+            candidates = [self.input_path]
+
+        snapshot = {}
+        for path in candidates:
+            fname = os.path.basename(path)
+            # Skip lock files Excel creates next to open workbooks
+            if fname.startswith("~$") or not fname.endswith(self.extensions):
+                continue
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue  # Removed between listing and stat
+            snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def watch(self, callback):
+        """
+        Block and call `callback` with the list of changed files once per debounce window.
+
+        Files present when watching starts are taken as the baseline and are not emitted.
+        Runs until `stop` is called or the process is interrupted.
+
+        Args:
+            callback (Callable[[list[str]], Any]): Receives the sorted paths of changed files.
+        """
+        known = self.scan()
+        pending = set()
+        last_change = 0.0
+        self._running = True
+        logger.info(f"Watching '{self.input_path}' for changes to {', '.join(self.extensions)} files...")
+
+        while self._running:
+            time.sleep(self.interval)
+            current = self.scan()
+
+            changed = [path for path, signature in current.items() if known.get(path) != signature]
+            known = current
+            if changed:
+                pending.update(changed)
+                last_change = time.monotonic()
+                logger.info(f"Detected changes: {changed}")
+                continue
+
+            if pending and time.monotonic() - last_change >= self.debounce:
+                # Files deleted during the window are not reprocessed
+                batch = sorted(path for path in pending if path in current)
+                pending.clear()
+                if batch:
+                    logger.info(f"Reprocessing {len(batch)} changed file(s)...")
+                    try:
+                        callback(batch)
+                    except Exception as e:
+                        logger.error(f"Failed to process changed files {batch}: {e}")
+
+    def stop(self):
+        """Stop a running `watch` loop after its current scan."""
+        self._running = False
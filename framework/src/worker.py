@@ -0,0 +1,93 @@
+import os
+import socket
+import threading
+import time
+import uuid
+from logging_config import LoggingConfig
+from framework.src.job_queue import JobQueue
+
+logger = LoggingConfig.setup("worker")
+
+class Worker:
+    def __init__(self, framework, queue: JobQueue, worker_id: str = None, lease_seconds: float = 60.0,
+                 poll_interval: float = 2.0):
+        """
+        Process plugin-run jobs from a JobQueue, one at a time.
+
+        Start as many workers as needed, on one host or on several hosts sharing the
+        queue file. A worker renews its lease while a job runs; if it dies, the lease
+        runs out and another worker picks the job up again.
+
+        Args:
+            framework (Framework): Framework used to execute the plugins.
+            queue (JobQueue): Queue to take jobs from.
+            worker_id (str, optional): Unique worker name. Defaults to host, PID and a random suffix.
+            lease_seconds (float): Lease duration; heartbeats are sent every third of it.
+            poll_interval (float): Seconds to wait before polling an empty queue again.
+        """
+        self.framework = framework
+        self.queue = queue
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self._running = False
+
+    def run(self, once: bool = False):
+        """
+        Process jobs until stopped or interrupted.
+
+        Args:
+            once (bool): Return as soon as the queue is empty instead of waiting for new jobs.
+        """
+        self._running = True
+        logger.info(f"Worker '{self.worker_id}' started on queue '{self.queue.db_path}'.")
+
+        try:
+            while self._running:
+                job = self.queue.claim(self.worker_id, self.lease_seconds)
+                if job is None:
+                    if once:
+                        break
+                    time.sleep(self.poll_interval)
+                    continue
+                self.process(job)
+        except KeyboardInterrupt:
+            logger.info(f"Worker '{self.worker_id}' interrupted.")
+
+        logger.info(f"Worker '{self.worker_id}' stopped.")
+
+    def stop(self):
+        """Stop the worker after its current job."""
+        self._running = False
+
+    def process(self, job: dict):
+        """Run a claimed job while keeping its lease alive, then record the outcome."""
+        logger.info(f"Worker '{self.worker_id}' running job {job['id']} (attempt {job['attempts']}).")
+
+        finished = threading.Event()
+        heartbeat = threading.Thread(target=self._heartbeat, args=(job["id"], finished), daemon=True)
+        heartbeat.start()
+
+        error = None
+        try:
+            result = self.framework.run_plugin(job["plugin"], job["input"], job["graphdb"], job["params"],
+                                               raise_errors=True)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            logger.error(f"Job {job['id']} raised an error: {error}")
+        finally:
+            finished.set()
+            heartbeat.join()
+
+        if error is None:
+            self.queue.complete(job["id"], self.worker_id, result)
+            logger.info(f"Job {job['id']} done.")
+        else:
+            self.queue.fail(job["id"], self.worker_id, error)
+            logger.error(f"Job {job['id']} failed.")
+
+    def _heartbeat(self, job_id: int, finished: threading.Event):
+        while not finished.wait(self.lease_seconds / 3):
+            if not self.queue.heartbeat(job_id, self.worker_id, self.lease_seconds):
+                logger.warning(f"Worker '{self.worker_id}' lost the lease on job {job_id}.")
+                return
@@ -0,0 +1,55 @@
+import requests
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, json_data=None, text="", headers=None, content=b""):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+        self._json = json_data
+        self._content = content
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def json(self):
+        return self._json
+
+    def iter_content(self, chunk_size=1):
+        for start in range(0, len(self._content), chunk_size):
+            yield self._content[start:start + chunk_size]
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error")
+
+
+class FakeGraphDB:
+    """Stand-in for the GraphDB HTTP API: records every request and answers from a route table."""
+
+    def __init__(self, monkeypatch, routes=None):
+        self.routes = routes or {}  # (method, URL suffix) -> FakeResponse, or callable returning one
+        self.calls = []
+        for method in ("get", "post", "put", "delete"):
+            monkeypatch.setattr(requests, method, self._handler(method.upper()))
+        monkeypatch.setattr(requests, "request", lambda method, url, **kwargs: self._handler(method.upper())(url, **kwargs))
+
+    def _handler(self, method):
+        def handle(url, **kwargs):
+            data = kwargs.get("data")
+            if data is not None and not isinstance(data, (bytes, str, dict)):
+                kwargs["data"] = b"".join(data)  # Drain streamed bodies like a real upload
+            self.calls.append((method, url, kwargs))
+            path = url.split("?")[0]
+            for (route_method, suffix), response in self.routes.items():
+                if route_method == method and path.endswith(suffix):
+                    return response(**kwargs) if callable(response) else response
+            return FakeResponse(204)
+        return handle
+
+    def requests_to(self, method, suffix):
+        return [kwargs for call_method, url, kwargs in self.calls
+                if call_method == method and url.split("?")[0].endswith(suffix)]
@@ -0,0 +1,79 @@
+import os
+
+from framework.src.checkpoint import CheckpointJournal
+
+
+def _files(tmp_path):
+    workbook, ttl = tmp_path / "site.xlsx", tmp_path / "site.ttl"
+    workbook.write_bytes(b"workbook")
+    ttl.write_text("<a> <b> <c> .\n")
+    return str(workbook), str(ttl)
+
+
+def test_resume_skips_unchanged_work(tmp_path):
+    workbook, ttl = _files(tmp_path)
+    path = str(tmp_path / "journal.jsonl")
+    journal = CheckpointJournal(path)
+    journal.mark_transformed(workbook, ttl)
+    journal.mark_committed([ttl], "network")
+
+    resumed = CheckpointJournal(path, resume=True)
+    assert resumed.transformed_output(workbook) == os.path.abspath(ttl)
+    assert resumed.is_committed(ttl, "network")
+    assert not resumed.is_committed(ttl, "other")
+
+    # A new run without resume starts from an empty journal
+    assert CheckpointJournal(path).transformed_output(workbook) is None
+
+
+def test_changed_files_are_not_skipped(tmp_path):
+    workbook, ttl = _files(tmp_path)
+    journal = CheckpointJournal(str(tmp_path / "journal.jsonl"))
+    journal.mark_transformed(workbook, ttl)
+    journal.mark_committed([ttl], "network")
+
+    with open(workbook, "ab") as f:
+        f.write(b" edited")
+    with open(ttl, "a") as f:
+        f.write("<a> <b> <d> .\n")
+
+    assert journal.transformed_output(workbook) is None
+    assert not journal.is_committed(ttl, "network")
+
+
+def test_reload_ignores_a_truncated_last_entry(tmp_path):
+    workbook, ttl = _files(tmp_path)
+    path = str(tmp_path / "journal.jsonl")
+    journal = CheckpointJournal(path)
+    journal.mark_transformed(workbook, ttl)
+    journal.mark_committed([ttl], "network")
+
+    # Simulate a crash in the middle of writing the commit entry
+    with open(path, "rb") as f:
+        content = f.read()
+    with open(path, "wb") as f:
+        f.write(content[:-20])
+
+    resumed = CheckpointJournal(path, resume=True)
+    assert resumed.transformed_output(workbook) == os.path.abspath(ttl)
+    assert not resumed.is_committed(ttl, "network")
+
+    # Entries appended after the damaged line are still read
+    resumed.mark_committed([ttl], "network")
+    assert CheckpointJournal(path, resume=True).is_committed(ttl, "network")
+
+
+def test_reinference_is_needed_again_after_a_commit(tmp_path):
+    _, ttl = _files(tmp_path)
+    path = str(tmp_path / "journal.jsonl")
+    journal = CheckpointJournal(path)
+    journal.mark_committed([ttl], "network")
+    assert journal.needs_reinference("network", "owl2-rl")
+
+    journal.mark_reinferred("network", "owl2-rl")
+    resumed = CheckpointJournal(path, resume=True)
+    assert not resumed.needs_reinference("network", "owl2-rl")
+    assert resumed.needs_reinference("network", "rdfsplus")
+
+    resumed.mark_committed([ttl], "network")
+    assert CheckpointJournal(path, resume=True).needs_reinference("network", "owl2-rl")
@@ -0,0 +1,97 @@
+from framework.src.core import Framework
+from framework.src.checkpoint import CheckpointJournal
+from framework.src.database_manager import DatabaseManager
+from framework.tests.fake_graphdb import FakeGraphDB, FakeResponse
+
+
+class _StreamingPlugin:
+    supports_streaming = True
+    stream_mime_type = "text/turtle"
+
+    def __init__(self, sources):
+        self.sources = sources  # source -> graph
+
+    def info(self):
+        return {"parameters": {"repository": {"default": "network"}}}
+
+    def stream(self, params):
+        for source, graph in self.sources.items():
+            yield source, graph, iter([f"<urn:{source}> <urn:p> ", "<urn:o> .\n"])
+
+
+def _framework(monkeypatch, tmp_path, plugin):
+    framework = Framework(checkpoint_dir=str(tmp_path / "checkpoints"))
+    monkeypatch.setattr(framework._plugin_manager, "get_plugin", lambda name: plugin)
+    monkeypatch.setattr(framework._plugin_manager, "stream_plugin", lambda name, params: plugin.stream(params))
+    database_manager = DatabaseManager()
+    database_manager.connect("http://graphdb:7200")
+    return framework, database_manager
+
+
+def test_stream_uploads_each_source_into_its_graph(monkeypatch, tmp_path):
+    graphdb = FakeGraphDB(monkeypatch)
+    plugin = _StreamingPlugin({"a": "urn:graph:a", "b": None})
+    framework, database_manager = _framework(monkeypatch, tmp_path, plugin)
+    tee = tmp_path / "out" / "stream.ttl"
+
+    result = framework._stream_plugin("fake", {"tee": str(tee)}, database_manager)
+
+    assert result == {"repository": "network", "sources": ["a", "b"], "tee": str(tee)}
+    assert len(graphdb.requests_to("GET", "/rest/repositories/network")) == 1
+    put = graphdb.requests_to("PUT", "/repositories/network/statements")
+    post = graphdb.requests_to("POST", "/repositories/network/statements")
+    assert [request["params"] for request in put] == [{"context": "<urn:graph:a>"}]
+    assert [request["data"] for request in post] == [b"<urn:b> <urn:p> <urn:o> .\n"]
+    assert tee.read_bytes() == b"<urn:a> <urn:p> <urn:o> .\n<urn:b> <urn:p> <urn:o> .\n"
+
+
+def test_stream_stops_at_the_first_failed_source(monkeypatch, tmp_path):
+    graphdb = FakeGraphDB(monkeypatch, {("PUT", "/statements"): FakeResponse(500, text="Out of memory")})
+    framework, database_manager = _framework(monkeypatch, tmp_path, _StreamingPlugin({"a": "urn:graph:a",
+                                                                                       "b": "urn:graph:b"}))
+
+    assert framework._stream_plugin("fake", {"reinfer_ruleset": "owl2-rl"}, database_manager) is None
+    assert len(graphdb.requests_to("PUT", "/statements")) == 1
+    assert graphdb.requests_to("POST", "/statements") == []
+
+
+def test_stream_is_not_sent_to_an_unavailable_repository(monkeypatch, tmp_path):
+    graphdb = FakeGraphDB(monkeypatch, {("GET", "/rest/repositories/network"): FakeResponse(503)})
+    framework, database_manager = _framework(monkeypatch, tmp_path, _StreamingPlugin({"a": "urn:graph:a"}))
+
+    assert framework._stream_plugin("fake", {}, database_manager) is None
+    assert graphdb.requests_to("PUT", "/statements") == []
+
+
+def test_resumed_stream_only_sends_changed_sources(monkeypatch, tmp_path):
+    graphdb = FakeGraphDB(monkeypatch)
+    workbooks = []
+    for name in ("a", "b"):
+        path = tmp_path / f"{name}.xlsx"
+        path.write_bytes(name.encode())
+        workbooks.append(str(path))
+    plugin = _StreamingPlugin({workbooks[0]: "urn:graph:a", workbooks[1]: "urn:graph:b"})
+    framework, database_manager = _framework(monkeypatch, tmp_path, plugin)
+    journal = str(tmp_path / "journal.jsonl")
+    params = {"reinfer_ruleset": "owl2-rl"}
+
+    def run():
+        graphdb.calls.clear()
+        checkpoint = CheckpointJournal(journal, resume=True)
+        result = framework._stream_plugin("fake", params, database_manager, checkpoint)
+        graphs = [request["params"]["context"] for request in graphdb.requests_to("PUT", "/statements")]
+        reinferred = any(b"sys:reinfer" in request["data"] for request in graphdb.requests_to("POST", "/statements"))
+        return result, graphs, reinferred
+
+    result, graphs, reinferred = run()
+    assert result["sources"] == workbooks
+    assert graphs == ["<urn:graph:a>", "<urn:graph:b>"] and reinferred
+
+    result, graphs, reinferred = run()
+    assert result["sources"] == workbooks
+    assert graphs == [] and not reinferred
+
+    with open(workbooks[1], "ab") as f:
+        f.write(b" edited")
+    result, graphs, reinferred = run()
+    assert graphs == ["<urn:graph:b>"] and reinferred
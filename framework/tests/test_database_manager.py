@@ -0,0 +1,229 @@
+import os
+
+from framework.src.database_manager import DatabaseManager, REPOSITORY_PROFILES
+from framework.tests.fake_graphdb import FakeGraphDB, FakeResponse
+
+
+def _manager(import_directory=None):
+    manager = DatabaseManager()
+    manager.connect("http://graphdb:7200", import_directory)
+    return manager
+
+
+def _ttl_files(tmp_path, *names):
+    paths = []
+    for name in names:
+        path = tmp_path / f"{name}.ttl"
+        path.write_text(f"<urn:{name}> <urn:p> <urn:o> .\n")
+        paths.append(str(path))
+    return paths
+
+
+def test_import_without_shared_directory_falls_back_to_upload(monkeypatch, tmp_path):
+    graphdb = FakeGraphDB(monkeypatch)
+    files = _ttl_files(tmp_path, "a", "b")
+
+    imported = _manager().import_files(files, "network", contexts={files[0]: "urn:graph:a"})
+
+    assert imported == files
+    assert graphdb.requests_to("POST", "/import/server") == []
+    # The file with a graph replaces it; the other one is added
+    assert graphdb.requests_to("PUT", "/statements")[0]["params"] == {"context": "<urn:graph:a>"}
+    assert len(graphdb.requests_to("POST", "/statements")) == 1
+
+
+def test_rejected_import_request_falls_back_to_upload(monkeypatch, tmp_path):
+    import_directory = tmp_path / "import"
+    import_directory.mkdir()
+    graphdb = FakeGraphDB(monkeypatch, {("POST", "/import/server"): FakeResponse(400, text="bad settings")})
+    files = _ttl_files(tmp_path, "a")
+
+    imported = _manager(str(import_directory)).import_files(files, "network")
+
+    assert imported == files
+    assert len(graphdb.requests_to("POST", "/statements")) == 1
+    assert os.listdir(import_directory) == []
+
+
+def test_finished_import_reports_files_and_cleans_up(monkeypatch, tmp_path):
+    import_directory = tmp_path / "import"
+    import_directory.mkdir()
+    files = _ttl_files(tmp_path, "a", "b")
+
+    def status(**kwargs):
+        batch = os.listdir(import_directory)[0]
+        return FakeResponse(200, [{"name": f"{batch}/a.ttl", "status": "DONE"},
+                               {"name": f"{batch}/b.ttl", "status": "ERROR", "message": "parse error"}])
+
+    graphdb = FakeGraphDB(monkeypatch, {("GET", "/import/server"): status})
+    imported = _manager(str(import_directory)).import_files(files, "network", poll_interval=0,
+                                                            contexts={files[0]: "urn:graph:a"})
+
+    assert imported == files[:1]
+    settings = [request["json"]["importSettings"] for request in graphdb.requests_to("POST", "/import/server")]
+    assert {"context": "urn:graph:a", "replaceGraphs": ["urn:graph:a"]} in settings
+    assert os.listdir(import_directory) == []
+
+
+def test_staged_files_are_kept_while_an_import_is_running(monkeypatch, tmp_path):
+    import_directory = tmp_path / "import"
+    import_directory.mkdir()
+    files = _ttl_files(tmp_path, "a")
+
+    def status(**kwargs):
+        batch = os.listdir(import_directory)[0]
+        return FakeResponse(200, [{"name": f"{batch}/a.ttl", "status": "IMPORTING"}])
+
+    FakeGraphDB(monkeypatch, {("GET", "/import/server"): status})
+    assert _manager(str(import_directory)).import_files(files, "network", poll_interval=0, timeout=0) == []
+
+    batch = os.listdir(import_directory)
+    assert len(batch) == 1
+    assert os.listdir(import_directory / batch[0]) == ["a.ttl"]
+
+
+def test_staged_files_are_kept_if_polling_fails_after_the_import_started(monkeypatch, tmp_path):
+    import_directory = tmp_path / "import"
+    import_directory.mkdir()
+    files = _ttl_files(tmp_path, "a")
+
+    FakeGraphDB(monkeypatch, {("GET", "/import/server"): FakeResponse(503)})
+    assert _manager(str(import_directory)).import_files(files, "network", poll_interval=0) == []
+    assert len(os.listdir(import_directory)) == 1
+
+
+def test_missing_repository_is_created_from_a_turtle_config(monkeypatch):
+    graphdb = FakeGraphDB(monkeypatch, {("GET", "/rest/repositories/network"): FakeResponse(404),
+                                     ("POST", "/rest/repositories"): FakeResponse(201)})
+
+    for profile, settings in REPOSITORY_PROFILES.items():
+        graphdb.calls.clear()
+        assert _manager().check_connection("network", profile)
+
+        name, config, mime_type = graphdb.requests_to("POST", "/rest/repositories")[0]["files"]["config"]
+        config = config.decode("utf-8")
+        assert mime_type == "text/turtle"
+        assert 'rep:repositoryID "network"' in config
+        for key, value in settings.items():
+            assert f'graphdb:{key} "{value}" ;' in config
+
+
+def test_failed_repository_creation_is_reported(monkeypatch):
+    FakeGraphDB(monkeypatch, {("GET", "/rest/repositories/network"): FakeResponse(404),
+                           ("POST", "/rest/repositories"): FakeResponse(400, text="Invalid config")})
+
+    assert not _manager().check_connection("network", "bulk-load")
+    assert not _manager().check_connection("network", "no-such-profile")
+
+
+def test_existing_repository_is_not_recreated(monkeypatch):
+    graphdb = FakeGraphDB(monkeypatch, {("GET", "/rest/repositories/network"): FakeResponse(200, {"id": "network"})})
+
+    assert _manager().check_connection("network")
+    assert graphdb.requests_to("POST", "/rest/repositories") == []
+
+
+def test_switch_ruleset_adds_activates_and_reinfers(monkeypatch):
+    graphdb = FakeGraphDB(monkeypatch)
+
+    assert _manager().switch_ruleset("network", "owl2-rl")
+
+    updates = [request["data"].decode("utf-8") for request in graphdb.requests_to("POST", "/repositories/network/statements")]
+    assert len(updates) == 3
+    assert 'sys:addRuleset "owl2-rl"' in updates[0]
+    assert 'sys:defaultRuleset "owl2-rl"' in updates[1]
+    assert "sys:reinfer" in updates[2]
+
+    graphdb.calls.clear()
+    assert _manager().switch_ruleset("network", "owl2-rl", reinfer=False)
+    assert len(graphdb.calls) == 2
+
+
+def test_switch_ruleset_stops_at_the_first_failed_update(monkeypatch):
+    graphdb = FakeGraphDB(monkeypatch, {("POST", "/statements"): FakeResponse(400, text="Unknown ruleset")})
+
+    assert not _manager().switch_ruleset("network", "no-such-ruleset")
+    assert len(graphdb.calls) == 1
+
+
+def test_upload_stream_sends_chunks_and_copies_them_to_the_tee(monkeypatch, tmp_path):
+    graphdb = FakeGraphDB(monkeypatch)
+    tee_path = tmp_path / "copy.ttl"
+
+    with open(tee_path, "wb") as tee:
+        assert _manager().upload_stream(iter(["<urn:a> ", b"<urn:p> ", "<urn:o> .\n"]), "network", tee=tee)
+
+    request = graphdb.requests_to("POST", "/repositories/network/statements")[0]
+    assert request["data"] == b"<urn:a> <urn:p> <urn:o> .\n"
+    assert request["params"] == {}
+    assert tee_path.read_bytes() == request["data"]
+    # The repository is checked by the caller, once per run
+    assert graphdb.requests_to("GET", "/rest/repositories/network") == []
+
+
+def test_upload_stream_replaces_a_named_graph_with_put(monkeypatch):
+    graphdb = FakeGraphDB(monkeypatch)
+
+    assert _manager().upload_stream(iter(["<urn:a> <urn:p> <urn:o> .\n"]), "network",
+                                    context="urn:graph:a", replace=True)
+    assert _manager().upload_stream(iter(["<urn:a> <urn:p> <urn:o> .\n"]), "network", context="urn:graph:a")
+
+    assert graphdb.requests_to("PUT", "/statements")[0]["params"] == {"context": "<urn:graph:a>"}
+    assert graphdb.requests_to("POST", "/statements")[0]["params"] == {"context": "<urn:graph:a>"}
+
+
+def test_upload_stream_reports_a_rejected_document(monkeypatch):
+    FakeGraphDB(monkeypatch, {("POST", "/statements"): FakeResponse(400, text="Parse error")})
+    assert not _manager().upload_stream(iter(["not turtle"]), "network")
+
+
+def _contexts(*graphs):
+    return FakeResponse(200, {"results": {"bindings": [{"contextID": {"value": graph}} for graph in graphs]}})
+
+
+def test_export_by_graph_writes_one_file_per_graph(monkeypatch, tmp_path):
+    graphdb = FakeGraphDB(monkeypatch, {("GET", "/contexts"): _contexts("urn:graph:a", "urn:graph:b"),
+                                        ("GET", "/statements"): FakeResponse(200, content=b"<urn:a> <urn:p> <urn:o> .\n")})
+
+    files = _manager().export_repository("network", str(tmp_path), workers=2)
+
+    assert len(files) == 3
+    assert os.path.basename(files[0]) == "default.ttl"
+    contexts = sorted(request["params"]["context"] for request in graphdb.requests_to("GET", "/statements"))
+    assert contexts == ["<urn:graph:a>", "<urn:graph:b>", "null"]
+    assert all(open(path, "rb").read() == b"<urn:a> <urn:p> <urn:o> .\n" for path in files)
+
+
+def test_export_by_subject_splits_hash_digits_over_the_parts(monkeypatch, tmp_path):
+    graphdb = FakeGraphDB(monkeypatch, {("POST", "/repositories/network"): FakeResponse(200, content=b"")})
+
+    files = _manager().export_repository("network", str(tmp_path), rdf_format="ntriples",
+                                         partition="subject", partitions=3)
+
+    assert [os.path.basename(path) for path in files] == ["part-00.nt", "part-01.nt", "part-02.nt"]
+    queries = [request["data"].decode("utf-8") for request in graphdb.requests_to("POST", "/repositories/network")]
+    assert all(query.startswith("CONSTRUCT") for query in queries)
+    # Every hex digit belongs to exactly one part, and blank nodes go to the first
+    digits = [digit for query in queries for digit in query.split("IN (")[1].split(")")[0].split(", ")]
+    assert sorted(digits) == sorted(f'"{digit:x}"' for digit in range(16))
+    assert "isBlank(?s) ||" in queries[0] and "isBlank(?s) ||" not in queries[1]
+
+
+def test_export_rejects_invalid_options(monkeypatch, tmp_path):
+    graphdb = FakeGraphDB(monkeypatch)
+    manager = _manager()
+
+    assert manager.export_repository("network", str(tmp_path), rdf_format="nquads", partition="subject") == []
+    assert manager.export_repository("network", str(tmp_path), rdf_format="trig", partition="subject") == []
+    assert manager.export_repository("network", str(tmp_path), partition="subject", partitions=17) == []
+    assert manager.export_repository("network", str(tmp_path), workers=0) == []
+    assert manager.export_repository("network", str(tmp_path), rdf_format="jsonld") == []
+    assert graphdb.calls == []
+
+
+def test_failed_export_leaves_no_partial_file(monkeypatch, tmp_path):
+    FakeGraphDB(monkeypatch, {("GET", "/contexts"): _contexts(),
+                              ("GET", "/statements"): FakeResponse(500)})
+
+    assert _manager().export_repository("network", str(tmp_path), compress=True) == []
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,102 @@
+import time
+
+from framework.src.job_queue import JobQueue, QUEUED, RUNNING, DONE, FAILED
+from framework.src.worker import Worker
+from framework.src.core import Framework
+
+
+def _queue(tmp_path, **kwargs):
+    return JobQueue(str(tmp_path / "jobs.db"), **kwargs)
+
+
+def test_claim_leases_oldest_job_once(tmp_path):
+    queue = _queue(tmp_path)
+    first = queue.enqueue("mine_sweeper", "/data/a", "http://localhost:7200", {"profile": "bulk-load"})
+    queue.enqueue("mine_sweeper", "/data/b", "http://localhost:7200")
+
+    job = queue.claim("worker-1", lease_seconds=60)
+    assert job["id"] == first
+    assert job["status"] == RUNNING
+    assert job["worker"] == "worker-1"
+    assert job["params"] == {"profile": "bulk-load"}
+
+    other = queue.claim("worker-2", lease_seconds=60)
+    assert other["id"] != first
+
+
+def test_expired_lease_is_requeued_for_another_worker(tmp_path):
+    queue = _queue(tmp_path)
+    job_id = queue.enqueue("mine_sweeper", "/data/a", "http://localhost:7200")
+
+    queue.claim("dead-worker", lease_seconds=0.05)
+    time.sleep(0.1)
+
+    job = queue.claim("worker-2", lease_seconds=60)
+    assert job["id"] == job_id
+    assert job["worker"] == "worker-2"
+    assert job["attempts"] == 2
+
+    # The dead worker can no longer report a result for the job
+    assert not queue.complete(job_id, "dead-worker", ["late.ttl"])
+    assert queue.complete(job_id, "worker-2", ["out.ttl"])
+    assert queue.get(job_id)["status"] == DONE
+    assert queue.get(job_id)["result"] == ["out.ttl"]
+
+
+def test_job_fails_after_max_attempts(tmp_path):
+    queue = _queue(tmp_path, max_attempts=2)
+    job_id = queue.enqueue("mine_sweeper", "/data/a", "http://localhost:7200")
+
+    for worker in ("w1", "w2"):
+        queue.claim(worker, lease_seconds=0.05)
+        time.sleep(0.1)
+
+    assert queue.requeue_expired() == 1
+    job = queue.get(job_id)
+    assert job["status"] == FAILED
+    assert "Lease expired" in job["error"]
+    assert queue.claim("w3", lease_seconds=60) is None
+
+
+def test_heartbeat_keeps_lease_alive(tmp_path):
+    queue = _queue(tmp_path)
+    job_id = queue.enqueue("mine_sweeper", "/data/a", "http://localhost:7200")
+    queue.claim("worker-1", lease_seconds=0.2)
+
+    for _ in range(3):
+        time.sleep(0.1)
+        assert queue.heartbeat(job_id, "worker-1", lease_seconds=0.2)
+
+    assert queue.requeue_expired() == 0
+    assert queue.get(job_id)["status"] == RUNNING
+    assert not queue.heartbeat(job_id, "worker-2", lease_seconds=0.2)
+
+
+class _FailingFramework:
+    def run_plugin(self, plugin_name, input_path, graphdb_url, params, raise_errors=False):
+        raise ConnectionError("GraphDB unreachable")
+
+
+def test_worker_records_the_actual_error(tmp_path):
+    queue = _queue(tmp_path)
+    job_id = queue.enqueue("mine_sweeper", "/data/a", "http://localhost:7200")
+
+    Worker(_FailingFramework(), queue, worker_id="worker-1").run(once=True)
+
+    job = queue.get(job_id)
+    assert job["status"] == FAILED
+    assert job["error"] == "ConnectionError: GraphDB unreachable"
+    assert queue.list_jobs(QUEUED) == []
+
+
+def test_enqueued_paths_do_not_depend_on_the_worker_directory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    framework = Framework()
+    job_id = framework.enqueue_plugin("jobs.db", "mine_sweeper", "data", "http://localhost:7200",
+                                      {"tee": "out/stream.ttl", "import_directory": "graphdb/data", "resume": True})
+
+    job = JobQueue(str(tmp_path / "jobs.db")).get(job_id)
+    assert job["input"] == str(tmp_path / "data")
+    assert job["params"]["tee"] == str(tmp_path / "out" / "stream.ttl")
+    assert job["params"]["import_directory"] == str(tmp_path / "graphdb" / "data")
+    assert job["params"]["checkpoint_dir"] == str(tmp_path / ".kgtoolkit" / "checkpoints")
@@ -0,0 +1,128 @@
+import json
+
+from framework.src.shard_manager import ShardManager
+
+
+def _sharded(monkeypatch, responses, strategy="source"):
+    """Create a ShardManager whose shards answer every query with the given documents."""
+    shards = ShardManager([f"http://shard{i}:7200" for i in range(len(responses))], strategy)
+    for (manager, _), response in zip(shards._shards, responses):
+        monkeypatch.setattr(manager, "execute_sparql_query",
+                            lambda query, repository, accept=None, response=response: response)
+    return shards
+
+
+def _bindings(*rows):
+    return json.dumps({"head": {"vars": ["s", "label"]}, "results": {"bindings": list(rows)}})
+
+
+def _row(subject, label, subject_type="uri"):
+    return {"s": {"type": subject_type, "value": subject}, "label": {"type": "literal", "value": label}}
+
+
+def test_select_concatenates_rows_of_all_shards(monkeypatch):
+    shards = _sharded(monkeypatch, [
+        _bindings(_row("http://example.org/a", "A")),
+        _bindings(_row("http://example.org/b", "B"), _row("http://example.org/a", "A")),
+    ])
+
+    result = shards.select("SELECT ?s ?label WHERE { ?s ?p ?label }", "network")
+    assert result["head"]["vars"] == ["s", "label"]
+    assert [row["s"]["value"] for row in result["results"]["bindings"]] == [
+        "http://example.org/a", "http://example.org/b", "http://example.org/a"]
+
+    distinct = shards.select("SELECT ?s ?label WHERE { ?s ?p ?label }", "network", distinct=True)
+    assert len(distinct["results"]["bindings"]) == 2
+
+
+def test_select_keeps_blank_nodes_of_different_shards_apart(monkeypatch):
+    shards = _sharded(monkeypatch, [
+        _bindings(_row("b0", "first", "bnode")),
+        _bindings(_row("b0", "second", "bnode")),
+    ])
+
+    bindings = shards.select("SELECT ?s ?label WHERE { ?s ?p ?label }", "network", distinct=True)["results"]["bindings"]
+    assert [row["s"]["value"] for row in bindings] == ["s0_b0", "s1_b0"]
+    assert all(row["s"]["type"] == "bnode" for row in bindings)
+
+
+def test_ask_is_true_if_any_shard_matches(monkeypatch):
+    shards = _sharded(monkeypatch, [json.dumps({"head": {}, "boolean": False}),
+                                    json.dumps({"head": {}, "boolean": True})])
+    assert shards.select("ASK { ?s ?p ?o }", "network") == {"head": {}, "boolean": True}
+
+
+def test_select_fails_if_a_shard_fails(monkeypatch):
+    shards = _sharded(monkeypatch, [_bindings(), None])
+    assert shards.select("SELECT * WHERE { ?s ?p ?o }", "network") is None
+
+
+def test_construct_merges_triples_and_renames_blank_nodes(monkeypatch):
+    shared = '<http://example.org/a> <http://example.org/p> "_:not a node" .'
+    shards = _sharded(monkeypatch, [
+        f'{shared}\n_:b0 <http://example.org/p> _:b1 .\n',
+        f'{shared}\n_:b0 <http://example.org/p> <http://example.org/a> .\n',
+    ])
+
+    lines = shards.execute_sparql_query("CONSTRUCT WHERE { ?s ?p ?o }", "network").splitlines()
+    assert lines == [
+        shared,
+        "_:s0_b0 <http://example.org/p> _:s0_b1 .",
+        "_:s1_b0 <http://example.org/p> <http://example.org/a> .",
+    ]
+
+
+def test_graph_strategy_places_streams_by_graph(monkeypatch):
+    shards = _sharded(monkeypatch, [None, None, None], strategy="graph")
+    calls = []
+    for index, (manager, _) in enumerate(shards._shards):
+        monkeypatch.setattr(manager, "upload_stream",
+                            lambda *args, index=index: calls.append((index, args[5])) or True)
+
+    graph = "http://example.org/graph/site"
+    assert shards.upload_stream(iter(["x"]), "network", source="/a/site.xlsx", context=graph, replace=True)
+    assert shards.upload_stream(iter(["x"]), "network", source="/b/other.xlsx", context=graph, replace=True)
+    assert calls == [(shards.shard_index(graph), graph)] * 2
+
+
+def test_streamed_and_uploaded_sources_land_on_the_same_shard(monkeypatch):
+    for strategy in ("source", "graph"):
+        shards = _sharded(monkeypatch, [None] * 4, strategy=strategy)
+        placed = {}
+        for index, (manager, _) in enumerate(shards._shards):
+            record = lambda kind, index=index: placed.setdefault(kind, []).append(index) or True
+            monkeypatch.setattr(manager, "upload_stream", lambda *args, record=record: record("stream"))
+            monkeypatch.setattr(manager, "upload_file", lambda *args, record=record: record("file"))
+            monkeypatch.setattr(manager, "replace_graphs", lambda *args, record=record: record("batch"))
+            monkeypatch.setattr(manager, "import_files",
+                                lambda paths, *args, record=record: [path for path in paths if record("bulk")])
+
+        for name in ("network-policy", "network-policy2", "site-a", "site-b"):
+            graph = f"http://example.org/graph/{name}"
+            ttl = f"/out/{name}.ttl"
+            shards.upload_stream(iter([""]), "network", source=f"/in/{name}.xlsx", context=graph, replace=True)
+            shards.upload_file(ttl, "network", context=graph, replace=True)
+            shards.replace_graphs({graph: ttl}, "network")
+            shards.import_files([ttl], "network", contexts={ttl: graph})
+
+            shard = {kind: indexes.pop() for kind, indexes in placed.items()}
+            assert len(set(shard.values())) == 1, (strategy, name, shard)
+
+
+def test_select_distinct_queries_are_deduplicated_across_shards(monkeypatch):
+    row = _row("http://example.org/a", "A")
+    shards = _sharded(monkeypatch, [_bindings(row), _bindings(row)])
+
+    assert len(shards.select("select distinct ?s ?label where { ?s ?p ?label }", "network")["results"]["bindings"]) == 1
+    assert len(shards.select("SELECT REDUCED ?s ?label WHERE { ?s ?p ?label }", "network")["results"]["bindings"]) == 1
+    assert len(shards.select("SELECT ?s ?label WHERE { ?s ?p ?label }", "network")["results"]["bindings"]) == 2
+
+
+def test_execute_sparql_query_accepts_the_result_format(monkeypatch):
+    shards = _sharded(monkeypatch, [_bindings(_row("http://example.org/a", "A")),
+                                    _bindings(_row("http://example.org/b", "B"))])
+
+    result = json.loads(shards.execute_sparql_query("SELECT ?s ?label WHERE { ?s ?p ?label }", "network",
+                                                    accept="application/sparql-results+json"))
+    assert len(result["results"]["bindings"]) == 2
+    assert shards.execute_sparql_query("SELECT * WHERE { ?s ?p ?o }", "network", accept="text/csv") is None
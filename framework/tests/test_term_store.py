@@ -0,0 +1,64 @@
+from framework.src.term_store import TermStore
+
+
+def _store():
+    store = TermStore()
+    store.bind("ex", "http://example.org/")
+    return store
+
+
+def test_duplicate_triples_are_written_once():
+    store = _store()
+    a, b, knows = store.iri("ex:a"), store.iri("ex:b"), store.iri("ex:knows")
+    store.add(a, knows, b)
+    store.add(b, knows, a)
+    store.add(a, knows, b)
+
+    assert len(store) == 2
+    assert sorted(store.triples()) == [(a, knows, b), (b, knows, a)]
+    assert store.to_turtle().count("ex:a ex:knows ex:b .") == 1
+
+
+def test_deduplication_continues_after_serialising():
+    store = _store()
+    a, knows = store.iri("ex:a"), store.iri("ex:knows")
+    store.add(a, knows, a)
+    assert len(store) == 1
+
+    c = store.iri("ex:c")
+    store.add(a, knows, a)
+    store.add(a, knows, c)
+    assert sorted(store.triples()) == [(a, knows, a), (a, knows, c)]
+
+
+def test_terms_are_interned_once():
+    store = _store()
+    assert store.iri("ex:a") == store.iri("ex:a")
+    assert store.literal("1", datatype="xsd:integer") == store.literal("1", datatype="xsd:integer")
+    assert store.literal("1") != store.literal("1", language="en")
+
+
+def test_iris_without_a_bound_prefix_are_written_in_full():
+    store = _store()
+    assert store.term(store.iri("ex:a")) == "ex:a"
+    assert store.term(store.iri("http://other.org/a")) == "<http://other.org/a>"
+    assert store.term(store.iri("urn:x")) == "<urn:x>"
+
+
+def test_literals_are_escaped():
+    store = _store()
+    term = store.term(store.literal('say "hi"\\\nnext\rline'))
+    assert term == '"say \\"hi\\"\\\\\\nnext\\rline"'
+    assert "\n" not in term and "\r" not in term
+
+
+def test_serialize_yields_header_then_chunks():
+    store = _store()
+    p = store.iri("ex:p")
+    for i in range(5):
+        store.add(store.iri(f"ex:s{i}"), p, store.literal(i))
+
+    chunks = list(store.serialize(chunk_size=2))
+    assert chunks[0] == "@prefix ex: <http://example.org/> .\n\n"
+    assert len(chunks) == 4
+    assert "".join(chunks[1:]).count(" .\n") == 5
@@ -0,0 +1,59 @@
+import threading
+import time
+
+from framework.src.watch_manager import WatchManager
+
+
+def _watch_in_background(watcher):
+    batches = []
+
+    def callback(batch):
+        batches.append(batch)
+        watcher.stop()
+
+    thread = threading.Thread(target=watcher.watch, args=(callback,), daemon=True)
+    thread.start()
+    return thread, batches
+
+
+def test_changes_within_debounce_window_are_batched(tmp_path):
+    (tmp_path / "existing.xlsx").write_bytes(b"old")
+    watcher = WatchManager(str(tmp_path), interval=0.05, debounce=0.5)
+    thread, batches = _watch_in_background(watcher)
+    time.sleep(0.2)
+
+    (tmp_path / "a.xlsx").write_bytes(b"a")
+    time.sleep(0.15)
+    (tmp_path / "b.xlsx").write_bytes(b"b")
+    (tmp_path / "~$a.xlsx").write_bytes(b"lock")
+    (tmp_path / "notes.txt").write_text("ignored")
+
+    thread.join(timeout=5)
+    assert batches == [[str(tmp_path / "a.xlsx"), str(tmp_path / "b.xlsx")]]
+
+
+def test_modified_file_is_reported_and_baseline_is_not(tmp_path):
+    workbook = tmp_path / "policy.xlsx"
+    workbook.write_bytes(b"v1")
+    (tmp_path / "untouched.xlsx").write_bytes(b"same")
+    watcher = WatchManager(str(tmp_path), interval=0.05, debounce=0.2)
+    thread, batches = _watch_in_background(watcher)
+    time.sleep(0.2)
+
+    workbook.write_bytes(b"version 2")
+
+    thread.join(timeout=5)
+    assert batches == [[str(workbook)]]
+
+
+def test_no_batch_before_changes_settle(tmp_path):
+    watcher = WatchManager(str(tmp_path), interval=0.05, debounce=1.0)
+    thread, batches = _watch_in_background(watcher)
+    time.sleep(0.2)
+
+    (tmp_path / "a.xlsx").write_bytes(b"a")
+    time.sleep(0.5)
+    assert batches == []
+
+    thread.join(timeout=5)
+    assert batches == [[str(tmp_path / "a.xlsx")]]
@@ -1,28 +1,80 @@
 import os
 import pandas as pd
+from urllib.parse import quote
 from datetime import datetime
 from framework.src.plugin_base import PluginBase
+from framework.src.term_store import TermStore
 from logging_config import LoggingConfig
 
 logger = LoggingConfig.setup("mine_sweeper")
 
 class MineSweeper(PluginBase):
+    supports_streaming = True
+
     def info(self):
         return {
             "name": "mine_sweeper",
             "description": "Processes an Excel matrix and generates TTL for network policy relationships.",
             "parameters": {
                 "input": {
-                    "type": "file | directory",
+                    "type": "file | directory | list",
                     "required": False,
                     "default" : "plugins/mine_sweeper/data",
-                    "description": "Path to an Excel file or directory containing Excel files."
+                    "description": "Path to an Excel file, a directory containing Excel files, or a list of Excel files."
                 },
                 "repository": {
                     "type": "string",
                     "required": False,
                     "default": "network",
                     "description": "GraphDB repository name for uploading TTL files."
+                },
+                "bulk_import": {
+                    "type": "bool",
+                    "required": False,
+                    "default": False,
+                    "description": "Load TTL files through GraphDB's server-side import instead of HTTP upload."
+                },
+                "import_directory": {
+                    "type": "directory",
+                    "required": False,
+                    "default": "graphdb/data",
+                    "description": "Local path of the directory shared with GraphDB as its import directory."
+                },
+                "profile": {
+                    "type": "string",
+                    "required": False,
+                    "default": "default",
+                    "description": "Provisioning profile used if the repository has to be created (see REPOSITORY_PROFILES)."
+                },
+                "reinfer_ruleset": {
+                    "type": "string",
+                    "required": False,
+                    "default": None,
+                    "description": "Ruleset to switch the repository to after loading, followed by a single reinference."
+                },
+                "batch_upload": {
+                    "type": "bool",
+                    "required": False,
+                    "default": False,
+                    "description": "Replace the graphs of all generated TTL files in a single transaction."
+                },
+                "stream": {
+                    "type": "bool",
+                    "required": False,
+                    "default": False,
+                    "description": "Stream the Turtle of each workbook straight into its named graph in GraphDB instead of writing TTL files."
+                },
+                "tee": {
+                    "type": "file",
+                    "required": False,
+                    "default": None,
+                    "description": "When streaming, also write the streamed Turtle to this file."
+                },
+                "graph_base": {
+                    "type": "string",
+                    "required": False,
+                    "default": "http://example.org/graph/",
+                    "description": "Namespace of the named graphs; each workbook is loaded into <graph_base><workbook name>."
                 }
             }
         }
@@ -30,49 +82,127 @@ class MineSweeper(PluginBase):
     def run(self, params: dict):
         input_path = params.get("input")
         repository = params.get("repository", "network")
+        bulk_import = params.get("bulk_import", False)
+        import_directory = params.get("import_directory", "graphdb/data")
+        profile = params.get("profile", "default")
+        reinfer_ruleset = params.get("reinfer_ruleset")
+        batch_upload = params.get("batch_upload", False)
+        graph_base = params.get("graph_base", "http://example.org/graph/")
+
+        ttl_files = []
+        for excel_path in self._resolve_inputs(input_path):
+            ttl_path = self.checkpoint.transformed_output(excel_path) if self.checkpoint else None
+            if ttl_path:
+                logger.info(f"Skipping {excel_path}: already transformed into {ttl_path}.")
+            else:
+                ttl_path = self._process_excel(excel_path)
+                if ttl_path and self.checkpoint:
+                    self.checkpoint.mark_transformed(excel_path, ttl_path)
+            if ttl_path:
+                ttl_files.append(ttl_path)
+
+        logger.info(f"Generated TTL files: {ttl_files}")
+
+        # Files a resumed run already committed are not sent again
+        committed = [f for f in ttl_files if self.checkpoint and self.checkpoint.is_committed(f, repository)]
+        pending = [f for f in ttl_files if f not in committed]
+        if committed:
+            logger.info(f"Skipping TTL files already committed to '{repository}': {committed}")
+        
+        # Upload each TTL file to GraphDB
+        if not ttl_files:
+            logger.warning("No TTL files were generated.")
+        elif pending and not self.database_manager.check_connection(repository, profile):
+            logger.error(f"Repository '{repository}' is not available. Skipping upload.")
+            return []
+
+        # Each workbook replaces its own named graph, so cells cleared since the last
+        # load do not leave stale triples behind
+        graphs = {ttl_file: self._graph_for(ttl_file, graph_base) for ttl_file in pending}
+
+        if bulk_import:
+            uploaded = self.database_manager.import_files(pending, repository, import_directory,
+                                                          contexts=graphs) if pending else []
+            self._mark_committed(uploaded, repository)
+        elif batch_upload:
+            graph_files = {graph: ttl_file for ttl_file, graph in graphs.items()}
+            uploaded = pending if pending and self.database_manager.replace_graphs(graph_files, repository) else []
+            self._mark_committed(uploaded, repository)
+        else:
+            uploaded = []
+            for ttl_file in pending:
+                success = self.database_manager.upload_file(ttl_file, repository, context=graphs[ttl_file],
+                                                            replace=True)
+                if success:
+                    uploaded.append(ttl_file)
+                    self._mark_committed([ttl_file], repository)
+                else:
+                    logger.error(f"Failed to upload TTL file: {ttl_file}")
+
+        logger.info(f"Uploaded TTL files: {uploaded}")
+        uploaded = committed + uploaded
+
+        if reinfer_ruleset and uploaded:
+            # A resumed run only reinfers if a batch was committed after the last reinference
+            if self.checkpoint and not self.checkpoint.needs_reinference(repository, reinfer_ruleset):
+                logger.info(f"Skipping reinference: '{repository}' was already reinferred with '{reinfer_ruleset}'.")
+            elif self.database_manager.switch_ruleset(repository, reinfer_ruleset) and self.checkpoint:
+                self.checkpoint.mark_reinferred(repository, reinfer_ruleset)
+        return uploaded
+
+    def stream(self, params: dict):
+        """Yield the Turtle document of each workbook, with its named graph, without writing it to disk."""
+        graph_base = params.get("graph_base", "http://example.org/graph/")
+        for excel_path in self._resolve_inputs(params.get("input")):
+            logger.info(f"Streaming Excel file: {excel_path}")
+            data = self.load_excel_data(excel_path)
+            if not data:
+                logger.error(f"Failed to load data from {excel_path}. Skipping...")
+                continue
+
+            yield excel_path, self._graph_for(excel_path, graph_base), self._stream_document(data)
+
+    def _stream_document(self, data):
+        yield f"# Generated on {datetime.now()}\n\n"
+        yield from self.build_graph(data).serialize()
 
+    def _graph_for(self, path, graph_base):
+        # Workbooks and their TTL files share the file name, and so the graph
+        return graph_base + quote(os.path.splitext(os.path.basename(path))[0])
+
+    def _mark_committed(self, ttl_files, repository):
+        if self.checkpoint and ttl_files:
+            self.checkpoint.mark_committed(ttl_files, repository)
+
+    def _resolve_inputs(self, input_path) -> list[str]:
         # Fallback to plugin's data folder if input not given
         if not input_path:
             plugin_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
             input_path = os.path.join(plugin_root, "data")
             logger.info(f"No input specified. Using default data directory: {input_path}")
 
-        if not os.path.exists(input_path):
-            logger.error(f"Input path does not exist: {input_path}")
+        excel_files = []
 
-        ttl_files = []
-
-        if os.path.isdir(input_path):
+        if isinstance(input_path, list):
+            # Explicit set of workbooks, e.g. the changed files reported by watch mode
+            for full_path in input_path:
+                if full_path.endswith(".xlsx") and os.path.isfile(full_path):
+                    excel_files.append(full_path)
+                else:
+                    logger.error(f"Skipping invalid input file: {full_path}")
+        elif not os.path.exists(input_path):
+            logger.error(f"Input path does not exist: {input_path}")
+        elif os.path.isdir(input_path):
             # Process all Excel files in the directory
             for fname in os.listdir(input_path):
                 if fname.endswith(".xlsx"):
-                    full_path = os.path.join(input_path, fname)
-                    ttl_path = self._process_excel(full_path)
-                    if ttl_path:
-                        ttl_files.append(ttl_path)
+                    excel_files.append(os.path.join(input_path, fname))
         elif input_path.endswith(".xlsx"):
-            ttl_path = self._process_excel(input_path)
-            if ttl_path:
-                ttl_files.append(ttl_path)
+            excel_files.append(input_path)
         else:
             logger.error("Invalid input file format. Only .xlsx supported.")
 
-        logger.info(f"Generated TTL files: {ttl_files}")
-        
-        # Upload each TTL file to GraphDB
-        if not ttl_files:
-            logger.warning("No TTL files were generated.")
-
-        uploaded = []
-        for ttl_file in ttl_files:
-            success = self.database_manager.upload_file(ttl_file, repository)
-            if success:
-                uploaded.append(ttl_file)
-            else:
-                logger.error(f"Failed to upload TTL file: {ttl_file}")
-
-        logger.info(f"Uploaded TTL files: {uploaded}")
-        return uploaded
+        return excel_files
 
     def _process_excel(self, excel_path):
         logger.info(f"Processing Excel file: {excel_path}")
@@ -118,39 +248,35 @@ class MineSweeper(PluginBase):
             logger.error("No data received for transformation")
             return None
 
-        ttl_lines = [
-            f"# Generated on {datetime.now()}\n",
-            '@prefix ex: <http://example.org/> .',
-            '@prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .\n'
-        ]
-
-        nodes = {}
-        edges = []
+        return f"# Generated on {datetime.now()}\n\n" + self.build_graph(data).to_turtle()
 
-        for row_idx, source_service in enumerate(data["source_services"]):
-            for col_idx, target_service in enumerate(data["target_services"]):
-                connection_value = data["matrix"][row_idx][col_idx]
+    def build_graph(self, data) -> TermStore:
+        store = TermStore()
+        store.bind("ex", "http://example.org/")
+        store.bind("rdf", "http://www.w3.org/1999/02/22-rdf-syntax-ns#")
 
-                if connection_value in ['1', '2']:
-                    pattern_type = "Pattern1" if connection_value == '1' else "Pattern2"
-                    edges.append({
-                        "source": source_service,
-                        "target": target_service,
-                        "pattern": pattern_type
-                    })
+        rdf_type = store.iri("rdf:type")
+        patterns = {'1': store.iri("ex:Pattern1"), '2': store.iri("ex:Pattern2")}
+        source_ids = [store.iri(f"ex:{service}") for service in data["source_services"]]
+        target_ids = [store.iri(f"ex:{service}") for service in data["target_services"]]
+        typed = set()  # Services keep the category of the first connection they appear in
 
-                    if source_service not in nodes:
-                        nodes[source_service] = data["source_categories"][row_idx]
-                    if target_service not in nodes:
-                        nodes[target_service] = data["target_categories"][col_idx]
+        for row_idx, source_id in enumerate(source_ids):
+            for col_idx, target_id in enumerate(target_ids):
+                pattern_id = patterns.get(data["matrix"][row_idx][col_idx])
+                if pattern_id is None:
+                    continue
 
-        for service, category in nodes.items():
-            ttl_lines.append(f'ex:{service} rdf:type ex:{category} .')
+                store.add(source_id, pattern_id, target_id)
 
-        for edge in edges:
-            ttl_lines.append(f'ex:{edge["source"]} ex:{edge["pattern"]} ex:{edge["target"]} .')
+                if source_id not in typed:
+                    typed.add(source_id)
+                    store.add(source_id, rdf_type, store.iri(f"ex:{data['source_categories'][row_idx]}"))
+                if target_id not in typed:
+                    typed.add(target_id)
+                    store.add(target_id, rdf_type, store.iri(f"ex:{data['target_categories'][col_idx]}"))
 
-        return "\n".join(ttl_lines)
+        return store
 
     def save_ttl_data(self, ttl_data: str, source_path: str):
         ttl_filename = os.path.splitext(os.path.basename(source_path))[0] + ".ttl"